@@ -1,6 +1,8 @@
 """Auth routes — login, logout, load_user for AuthMiddleware."""
 
+import secrets
 from dataclasses import dataclass
+from functools import cache, lru_cache, partial
 
 from chirp import Redirect, Request, Template, get_user, is_safe_url, login, logout
 from chirp.security.passwords import hash_password, verify_password
@@ -14,24 +16,38 @@ class User:
     is_authenticated: bool = True
 
 
-_DEMO_HASH = hash_password("password")
-USERS: dict[str, User] = {
-    "admin": User(id="admin", name="Admin", password_hash=_DEMO_HASH),
-}
+# Password hashing is deliberately slow, so hashes are computed on first
+# use rather than whenever this module is imported.
+@cache
+def _users() -> dict[str, User]:
+    """Demo user table, built once on first lookup."""
+    return {
+        "admin": User(id="admin", name="Admin", password_hash=hash_password("password")),
+    }
+
+
+@cache
+def _dummy_hash() -> str:
+    """Hash verified against for unknown usernames so every login pays one check."""
+    return hash_password(secrets.token_urlsafe(16))
 
 
 async def load_user(user_id: str) -> User | None:
     """Load user by ID — called by AuthMiddleware on each request."""
-    return USERS.get(user_id)
+    return _users().get(user_id)
 
 
 path = "/login"
 nav_title = "Log in"
 
+_render_login = partial(Template, "login.html", title="Log in")
+# is_safe_url depends only on the URL string; redirect targets repeat a lot
+_is_safe_url = lru_cache(maxsize=256)(is_safe_url)
+
 
 async def get(request: Request):
     """Show login form."""
-    return Template("login.html", title="Log in", error="")
+    return _render_login(error="")
 
 
 async def post(request: Request):
@@ -40,12 +56,16 @@ async def post(request: Request):
     username = form.get("username", "")
     password = form.get("password", "")
 
-    user = USERS.get(username)
-    if user and verify_password(password, user.password_hash):
+    # Always run exactly one password verification so response time does
+    # not reveal whether the username exists.
+    user = _users().get(username)
+    target_hash = user.password_hash if user is not None else _dummy_hash()
+    ok = int(verify_password(password, target_hash))
+    if ok & int(user is not None):
         login(user)
         next_url = request.query.get("next", "/")
-        if not is_safe_url(next_url):
+        if not _is_safe_url(next_url):
             next_url = "/"
         return Redirect(next_url)
 
-    return Template("login.html", title="Log in", error="Invalid username or password")
+    return _render_login(error="Invalid username or password")
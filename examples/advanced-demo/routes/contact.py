@@ -1,5 +1,7 @@
 """Contact form — GET/POST with CSRF."""
 
+from functools import partial
+
 from chirp import Redirect, Request, Template
 from chirp.middleware.sessions import get_session
 
@@ -7,29 +9,23 @@ from chirp.middleware.sessions import get_session
 path = "/contact"
 nav_title = "Contact"
 
+_render_contact = partial(Template, "contact.html", title="Contact")
+_FIELDS = ("name", "email", "message")
+
 
 async def get(request: Request):
     """Show contact form."""
-    return Template("contact.html", title="Contact", error="", name="", email="", message="")
+    return _render_contact(error="", name="", email="", message="")
 
 
 async def post(request: Request):
     """Handle contact form submission."""
     form = await request.form()
-    name = form.get("name", "").strip()
-    email = form.get("email", "").strip()
-    message = form.get("message", "").strip()
-
-    if not name or not email or not message:
-        return Template(
-            "contact.html",
-            title="Contact",
-            error="Please fill in name, email, and message.",
-            name=name,
-            email=email,
-            message=message,
-        )
+    fields = {key: form.get(key, "").strip() for key in _FIELDS}
+
+    if not all(fields.values()):
+        return _render_contact(error="Please fill in name, email, and message.", **fields)
 
     session = get_session()
-    session["contact_name"] = name
+    session["contact_name"] = fields["name"]
     return Redirect("/thank-you")
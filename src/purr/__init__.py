@@ -16,10 +16,11 @@ Three modes::
     purr.build("my-site/")        # Static export
     purr.serve("my-site/")        # Live production server
 
-Site accessor (available after ``dev()`` or ``serve()`` initializes)::
+Site accessor and page search (available after ``dev()`` or ``serve()``
+initializes)::
 
-    from purr import site
-    results = site.search(query)
+    from purr import search, site
+    results = search(query)       # [Hit(title, href), ...]
 
 Part of the Bengal ecosystem:
 
@@ -33,11 +34,14 @@ Part of the Bengal ecosystem:
 
 """
 
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from bengal.core.site import Site
 
+    from purr.content.search import Hit, SearchIndex
+
 # PEP 703: Declare this module as free-threading safe
 _Py_mod_gil = 0
 
@@ -47,30 +51,97 @@ __all__ = [
     "__version__",
     "build",
     "dev",
+    "search",
     "serve",
     "site",
 ]
 
 # ---------------------------------------------------------------------------
-# Site accessor — set once at startup, immutable thereafter
+# Site accessor — set at startup together with the page search index
 # ---------------------------------------------------------------------------
 
 _site_ref: Site | None = None
+_search_index: SearchIndex | None = None
+# Guards _search_index so a dev-mode rebuild cannot overwrite a later
+# invalidation
+_search_lock = threading.Lock()
 
 
 def _set_site(site_instance: Site) -> None:
     """Store the Bengal Site for access by dynamic route handlers.
 
-    Called once during ``dev()`` or ``serve()`` initialization.  The Site
-    object is frozen/immutable, so a module-level reference is safe for
-    free-threading.
+    Called during ``dev()`` or ``serve()`` initialization.  Also builds
+    the search index used by :func:`search`, here rather than on the first
+    search: no request pays for indexing, and under ``purr serve`` the
+    index exists before the heap is frozen and workers fork, so they share
+    one copy.  In dev mode the reactive pipeline updates page content in
+    place; it calls :func:`_invalidate_search` rather than publishing the
+    site again.
 
     Args:
         site_instance: The loaded Bengal Site.
 
     """
-    global _site_ref  # noqa: PLW0603
-    _site_ref = site_instance
+    from purr.content.search import SearchIndex
+
+    index = SearchIndex(getattr(site_instance, "pages", None) or ())
+
+    global _site_ref, _search_index  # noqa: PLW0603
+    with _search_lock:
+        _site_ref = site_instance
+        _search_index = index
+
+
+def _invalidate_search() -> None:
+    """Mark the search index stale after an in-place page edit (dev mode).
+
+    The next :func:`search` rebuilds it, so a burst of saves costs at most
+    one rebuild.
+
+    """
+    global _search_index
+    with _search_lock:
+        _search_index = None
+
+
+def _current_search_index() -> SearchIndex | None:
+    """Return the search index for the published site, rebuilding it if stale."""
+    from purr.content.search import SearchIndex
+
+    global _search_index
+    with _search_lock:
+        if _search_index is None and _site_ref is not None:
+            _search_index = SearchIndex(getattr(_site_ref, "pages", None) or ())
+        return _search_index
+
+
+def search(query: str) -> list[Hit]:
+    """Search site pages by title and content.
+
+    Returns a ``Hit(title, href)`` for each matching page, in site page
+    order, or an empty list before the site is published (e.g. during
+    ``purr build``).  Each query token is a dict lookup in the index built
+    by ``_set_site()``.
+
+    Args:
+        query: Free-text query; every word must match.
+
+    """
+    index = _search_index
+    if index is None:
+        index = _current_search_index()
+        if index is None:
+            return []
+    return index.search(query)
+
+
+# Lazily imported public names -> (module, attribute)
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "PurrConfig": ("purr.config", "PurrConfig"),
+    "dev": ("purr.app", "dev"),
+    "build": ("purr.app", "build"),
+    "serve": ("purr.app", "serve"),
+}
 
 
 def __getattr__(name: str) -> object:
@@ -78,6 +149,10 @@ def __getattr__(name: str) -> object:
 
     Keeps ``import purr`` fast while providing a clean top-level API.
     The ``site`` attribute is a runtime reference set during initialization.
+
+    Lazy imports are resolved with a single table lookup and cached in the
+    module namespace, so later accesses bypass ``__getattr__`` entirely.
+    ``site`` is never cached — it can be re-set by ``_set_site()``.
     """
     if name == "site":
         if _site_ref is None:
@@ -88,25 +163,14 @@ def __getattr__(name: str) -> object:
             raise RuntimeError(msg)
         return _site_ref
 
-    if name == "PurrConfig":
-        from purr.config import PurrConfig
-
-        return PurrConfig
-
-    if name == "dev":
-        from purr.app import dev
-
-        return dev
-
-    if name == "build":
-        from purr.app import build
-
-        return build
-
-    if name == "serve":
-        from purr.app import serve
+    target = _LAZY_IMPORTS.get(name)
+    if target is not None:
+        from importlib import import_module
 
-        return serve
+        module_name, attr = target
+        value = getattr(import_module(module_name), attr)
+        globals()[name] = value
+        return value
 
     msg = f"module {__name__!r} has no attribute {name!r}"
     raise AttributeError(msg)
@@ -0,0 +1,83 @@
+"""Compiled template code shared by every Kida environment in the process.
+
+Each Chirp app gets its own Kida environment, and each environment compiles
+every template it loads.  Kida's automatic on-disk bytecode cache only
+applies to a bare ``FileSystemLoader``, so Purr's ``ChoiceLoader`` (theme
+directories, Chirp macros, chirp-ui) compiled the whole theme again for
+every new app: ``build`` then ``serve`` in one process, repeated ``dev``
+runs, the test suite.  :class:`MemoryBytecodeCache` keeps the compiled code
+objects in memory, keyed like Kida's own cache by template name and source
+hash, so an unchanged template compiles once per process.
+
+Thread Safety:
+    Code objects are immutable.  Lookups are plain dict reads; inserts and
+    eviction take a lock.  A race at worst compiles a template twice.
+
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from kida.bytecode_cache import BytecodeCache
+
+if TYPE_CHECKING:
+    from types import CodeType
+
+# Oldest entries are dropped beyond this, so edits in a long dev session
+# (each a new source hash) cannot grow the cache without limit
+_MAX_ENTRIES = 2048
+
+
+class MemoryBytecodeCache(BytecodeCache):
+    """``BytecodeCache`` that keeps compiled template code in memory.
+
+    Kida only accepts ``BytecodeCache`` instances, so this subclasses it
+    but skips the parent constructor, which creates a cache directory.
+    Nothing is written to disk.
+
+    """
+
+    def __init__(self) -> None:
+        self._code: dict[tuple[str, str, str | None], CodeType] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        name: str,
+        source_hash: str,
+        *,
+        context_hash: str | None = None,
+    ) -> CodeType | None:
+        """Return the cached code for this template source, if any."""
+        return self._code.get((name, source_hash, context_hash))
+
+    def set(
+        self,
+        name: str,
+        source_hash: str,
+        code: CodeType,
+        *,
+        context_hash: str | None = None,
+    ) -> None:
+        """Cache the compiled code for this template source."""
+        with self._lock:
+            self._code[(name, source_hash, context_hash)] = code
+            while len(self._code) > _MAX_ENTRIES:
+                del self._code[next(iter(self._code))]
+
+    def clear(self, current_version_only: bool = False) -> int:
+        """Drop all entries and return how many there were."""
+        with self._lock:
+            count = len(self._code)
+            self._code.clear()
+        return count
+
+    def cleanup(self, max_age_days: int = 30) -> int:
+        """No-op: entries are bounded by count, not age."""
+        return 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the entry count (``total_bytes`` is not tracked)."""
+        return {"file_count": len(self._code), "total_bytes": 0}
@@ -7,10 +7,54 @@ from __future__ import annotations
 
 import argparse
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _add_dev_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``purr dev`` arguments."""
+    parser.add_argument("root", nargs="?", default=".", help="Site root directory")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=3000, help="Bind port")
+
+
+def _add_build_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``purr build`` arguments."""
+    parser.add_argument("root", nargs="?", default=".", help="Site root directory")
+    parser.add_argument("--output", default="dist", help="Output directory")
+    parser.add_argument(
+        "--base-url", default="", help="Base URL for sitemap generation",
+    )
+    parser.add_argument(
+        "--fingerprint", action="store_true", help="Enable asset fingerprinting",
+    )
+
+
+def _add_serve_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``purr serve`` arguments."""
+    parser.add_argument("root", nargs="?", default=".", help="Site root directory")
+    parser.add_argument("--host", default="0.0.0.0", help="Bind address")
+    parser.add_argument("--port", type=int, default=8000, help="Bind port")
+    parser.add_argument("--workers", type=int, default=0, help="Worker count (0=auto)")
+
+
+# Subcommand -> (help text, argument builder)
+_COMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "dev": ("Start content-reactive development server", _add_dev_arguments),
+    "build": ("Export site as static HTML files", _add_build_arguments),
+    "serve": ("Run live production server", _add_serve_arguments),
+}
 
 
 def _build_parser() -> argparse.ArgumentParser:
-    """Build the argument parser for the purr CLI."""
+    """Build the full argument parser for the purr CLI.
+
+    Used for ``--help`` and anything that is not a known subcommand, so
+    top-level help and error messages list every command.
+
+    """
     parser = argparse.ArgumentParser(
         prog="purr",
         description="Content-reactive runtime for the Bengal ecosystem.",
@@ -22,40 +66,23 @@ def _build_parser() -> argparse.ArgumentParser:
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    for command, (help_text, add_arguments) in _COMMANDS.items():
+        add_arguments(subparsers.add_parser(command, help=help_text))
 
-    # purr dev
-    dev_parser = subparsers.add_parser(
-        "dev",
-        help="Start content-reactive development server",
-    )
-    dev_parser.add_argument("root", nargs="?", default=".", help="Site root directory")
-    dev_parser.add_argument("--host", default="127.0.0.1", help="Bind address")
-    dev_parser.add_argument("--port", type=int, default=3000, help="Bind port")
-
-    # purr build
-    build_parser = subparsers.add_parser(
-        "build",
-        help="Export site as static HTML files",
-    )
-    build_parser.add_argument("root", nargs="?", default=".", help="Site root directory")
-    build_parser.add_argument("--output", default="dist", help="Output directory")
-    build_parser.add_argument(
-        "--base-url", default="", help="Base URL for sitemap generation",
-    )
-    build_parser.add_argument(
-        "--fingerprint", action="store_true", help="Enable asset fingerprinting",
-    )
+    return parser
 
-    # purr serve
-    serve_parser = subparsers.add_parser(
-        "serve",
-        help="Run live production server",
-    )
-    serve_parser.add_argument("root", nargs="?", default=".", help="Site root directory")
-    serve_parser.add_argument("--host", default="0.0.0.0", help="Bind address")
-    serve_parser.add_argument("--port", type=int, default=8000, help="Bind port")
-    serve_parser.add_argument("--workers", type=int, default=0, help="Worker count (0=auto)")
 
+def _build_command_parser(command: str) -> argparse.ArgumentParser:
+    """Build a parser for a single subcommand.
+
+    Produces the same namespace as the matching branch of
+    :func:`_build_parser` without constructing the other subcommands.
+
+    """
+    help_text, add_arguments = _COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f"purr {command}", description=help_text)
+    add_arguments(parser)
+    parser.set_defaults(command=command)
     return parser
 
 
@@ -68,12 +95,22 @@ def _get_version() -> str:
 
 def main(argv: list[str] | None = None) -> None:
     """CLI entry point."""
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
 
-    if args.command is None:
-        parser.print_help()
+    # Fast paths: a subcommand or --version only needs what it uses
+    first = argv[0] if argv else None
+    if first == "--version":
+        print(f"purr {_get_version()}")
         sys.exit(0)
+    if first in _COMMANDS:
+        args = _build_command_parser(first).parse_args(argv[1:])
+    else:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        if args.command is None:
+            parser.print_help()
+            sys.exit(0)
 
     from purr.app import build, dev, serve
 
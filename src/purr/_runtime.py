@@ -0,0 +1,62 @@
+"""Interpreter and host probes shared by startup and the reactive pipeline.
+
+Several stages fan work out to a thread pool only when threads can run
+Python in parallel, i.e. on a free-threaded build with the GIL disabled.
+Serving also forks worker processes only on GIL builds.
+:func:`usable_cpu_count` counts the CPUs this process may actually use
+(the host's, minus affinity and container limits).  The probes live here
+so ``purr.app``, ``purr.content`` and ``purr.reactive`` share one
+definition without importing each other.
+
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+
+def gil_enabled() -> bool:
+    """Return False on a free-threaded build running without the GIL."""
+    is_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else bool(is_enabled())
+
+
+def cgroup_cpu_quota(cgroup_root: Path = Path("/sys/fs/cgroup")) -> int | None:
+    """Return the container CPU limit in whole CPUs (rounded up).
+
+    Reads cgroup v2 ``cpu.max``, falling back to the v1
+    ``cpu.cfs_quota_us`` / ``cpu.cfs_period_us`` pair.  Returns None when
+    no limit is set or the files are unavailable (non-Linux, no cgroups).
+
+    """
+    try:
+        quota_str, period_str = (cgroup_root / "cpu.max").read_text().split()[:2]
+        if quota_str == "max":
+            return None
+        quota, period = int(quota_str), int(period_str)
+    except (OSError, ValueError):
+        try:
+            quota = int((cgroup_root / "cpu" / "cpu.cfs_quota_us").read_text())
+            period = int((cgroup_root / "cpu" / "cpu.cfs_period_us").read_text())
+        except (OSError, ValueError):
+            return None
+
+    if quota <= 0 or period <= 0:
+        return None
+    return max(1, -(-quota // period))
+
+
+def usable_cpu_count() -> int:
+    """Return the CPUs this process may use: affinity, capped by cgroup quota.
+
+    ``os.cpu_count()`` reports the host's CPUs, which oversubscribes
+    containers with CPU limits or pinned affinity.
+
+    """
+    count = os.process_cpu_count() or 1
+    quota = cgroup_cpu_quota()
+    if quota is not None:
+        count = min(count, quota)
+    return count
@@ -0,0 +1,138 @@
+"""Static file middleware — reusable responses and a multi-directory chain.
+
+Chirp's ``StaticFiles`` opens and reads each asset into a fresh bytes object
+on every request.  Outside dev mode the asset set is fixed for the life of
+the process, so the finished response for each file is built once and then
+shared (Chirp responses are immutable).  The URL paths it has answered,
+and those it has no file for, are remembered too, so a repeat request
+costs a dict lookup instead of a path resolve and ``stat()`` calls.  A
+URL seen for the first time still goes through the parent's
+path-traversal and existence checks.
+
+Purr serves ``/static`` from several directories (user assets, then the
+bundled theme).  :class:`StaticFilesChain` mounts them as one middleware,
+so requests outside the prefix pay a single prefix check instead of one
+per directory.
+
+Thread Safety:
+    Responses are immutable and the caches only ever gain entries; a race
+    at worst builds the same response twice.  The chain holds an immutable
+    tuple of members.
+
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from chirp.middleware import StaticFiles
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from chirp.http.request import Request
+    from chirp.http.response import Response
+    from chirp.middleware.protocol import AnyResponse, Next
+
+# Larger files are read per request rather than held in memory
+_MAX_CACHED_BYTES = 1 << 20
+
+# Bound on remembered misses, so a crawler probing random URLs cannot grow
+# the set without limit (later misses just take the uncached path)
+_MAX_CACHED_MISSES = 4096
+
+
+class CachedStaticFiles(StaticFiles):
+    """``StaticFiles`` that keeps each served file's response in memory.
+
+    Only use where files do not change while the server runs (``purr
+    serve``); dev mode keeps the uncached middleware so edits show up.
+
+    """
+
+    __slots__ = ("_hits", "_misses", "_responses")
+
+    def __init__(
+        self,
+        directory: str | Path,
+        prefix: str = "/static",
+        *,
+        index: str = "index.html",
+        not_found_page: str | None = None,
+        cache_control: str = "public, max-age=3600",
+    ) -> None:
+        super().__init__(
+            directory,
+            prefix,
+            index=index,
+            not_found_page=not_found_page,
+            cache_control=cache_control,
+        )
+        self._responses: dict[tuple[Path, int], Response] = {}
+        # URL path -> response, keyed by the file's canonical URL
+        self._hits: dict[str, Response] = {}
+        # URL paths under the prefix that this directory cannot serve
+        self._misses: set[str] = set()
+
+    async def __call__(self, request: Request, next: Next) -> AnyResponse:
+        """Answer a known URL from memory, otherwise defer to ``StaticFiles``."""
+        if request.method in ("GET", "HEAD"):
+            path = request.path
+            response = self._hits.get(path)
+            if response is not None:
+                return response
+            if path in self._misses:
+                return await next(request)
+        return await super().__call__(request, next)
+
+    def _serve_file(self, file_path: Path, *, status: int = 200) -> Response:
+        key = (file_path, status)
+        response = self._responses.get(key)
+        if response is None:
+            response = super()._serve_file(file_path, status=status)
+            if len(response.body) <= _MAX_CACHED_BYTES:
+                self._responses[key] = response
+                if status == 200:
+                    url = self._prefix + "/" + file_path.relative_to(self._directory).as_posix()
+                    self._hits[url] = response
+        return response
+
+    async def _handle_not_found(self, next: Next, request: Request) -> AnyResponse:
+        # With a custom 404 page the parent must see every miss
+        if not self._not_found_page and len(self._misses) < _MAX_CACHED_MISSES:
+            self._misses.add(request.path)
+        return await super()._handle_not_found(next, request)
+
+
+class StaticFilesChain:
+    """One middleware serving a URL prefix from several ``StaticFiles``.
+
+    Members are tried in priority order: each one that misses falls through
+    to the next, and the last falls through to the application.  Requests
+    outside *prefix* skip the members entirely.
+
+    Args:
+        members: ``StaticFiles`` instances, highest priority first, all
+            mounted at *prefix*.
+        prefix: URL prefix shared by the members (e.g. ``"/static"``).
+
+    """
+
+    __slots__ = ("_members", "_prefix", "_prefix_slash")
+
+    def __init__(self, members: Sequence[StaticFiles], prefix: str = "/static") -> None:
+        self._members = tuple(members)
+        self._prefix = "/" + prefix.strip("/")
+        self._prefix_slash = self._prefix + "/"
+
+    async def __call__(self, request: Request, next: Next) -> AnyResponse:
+        """Serve from the first member that has the file, or fall through."""
+        path = request.path
+        if path != self._prefix and not path.startswith(self._prefix_slash):
+            return await next(request)
+        handler = next
+        for member in reversed(self._members):
+            handler = partial(member, next=handler)
+        return await handler(request)
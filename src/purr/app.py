@@ -4,23 +4,55 @@ PurrApp wraps a Bengal Site and a Chirp App into a single content-reactive appli
 The three public functions (dev, build, serve) are the primary entry points.
 """
 
+import functools
+import gc
 import importlib.util
+import os
+import stat
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from purr._errors import ConfigError, ContentError
-from purr.config import PurrConfig
-from purr.config_loader import load_config
+from purr._runtime import gil_enabled, usable_cpu_count
+from purr.observability.timing import reset_stages, stage
+from purr.routes.loader import RouteDefinition, build_nav_entries, discover_routes
+from purr.theme import get_asset_dirs, get_template_dirs, list_template_names
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from bengal.core.site import Site
-    from chirp import App
+    from chirp import App, AppConfig
+    from kida import ChoiceLoader, Environment
+    from patitas import Markdown
 
+    from purr._bytecode import MemoryBytecodeCache
+    from purr.config import PurrConfig
     from purr.content.router import ContentRouter
+    from purr.content.watcher import ContentWatcher
+    from purr.observability import StackCollector
     from purr.reactive.broadcaster import Broadcaster
-    from purr.routes.loader import RouteDefinition
+    from purr.reactive.pipeline import ReactivePipeline
+
+
+# Below this many pages a thread pool costs more than it saves
+_PARALLEL_PARSE_MIN_PAGES = 64
+
+
+@functools.cache
+def _markdown() -> Markdown:
+    """Return the process-wide Patitas ``Markdown`` processor.
+
+    Built on first use: the constructor sets up the plugin chain, and the
+    instance is immutable and thread-safe, so every site load shares it.
+
+    """
+    from patitas import Markdown
+
+    return Markdown(plugins=["table"])
 
 
 def _parse_pages(site: Site) -> None:
@@ -31,18 +63,108 @@ def _parse_pages(site: Site) -> None:
     Patitas' ``Markdown`` class directly with common extensions enabled
     (tables, strikethrough, task lists, footnotes).
     """
-    from patitas import Markdown
+    # Bound once: Patitas has no batch API, so this is the per-page call
+    render = _markdown().__call__
+
+    pages = [page for page in site.pages if getattr(page, "_raw_content", "")]
+    sources = [page._raw_content for page in pages]
+
+    # Markdown instances are safe to share across threads; on a
+    # free-threaded build large sites parse across cores.
+    if len(pages) >= _PARALLEL_PARSE_MIN_PAGES and not gil_enabled():
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=usable_cpu_count()) as pool:
+            htmls = list(pool.map(render, sources))
+    else:
+        htmls = list(map(render, sources))
+
+    for page, html in zip(pages, htmls, strict=True):
+        page.html_content = html
+
+
+# Loaded sites keyed by resolved root -> (config mtime_ns, site).  Bounded so
+# a long-lived process that touches many roots (tests, tooling) stays small.
+_SITE_CACHE_SIZE = 8
+_site_cache: dict[Path, tuple[int, Site]] = {}
+_site_cache_lock = threading.Lock()
 
-    md = Markdown(plugins=["table"])
+# Bengal's single-file config names, in its lookup order
+_BENGAL_CONFIG_NAMES = ("bengal.toml", "bengal.yaml", "bengal.yml")
 
-    for page in site.pages:
-        raw = getattr(page, "_raw_content", "") or ""
-        if not raw:
+
+def _config_mtime_ns(root: Path) -> int:
+    """Return the modification time of Bengal's config for *root* (0 if none).
+
+    Mirrors Bengal's lookup: a ``config/`` directory wins (newest file in
+    it), else the first of ``bengal.toml`` / ``.yaml`` / ``.yml``.  Only
+    config is checked: content and data edits do not change the result.
+
+    """
+    config_dir = root / "config"
+    if config_dir.is_dir():
+        latest = 0
+        for dirpath, _dirnames, filenames in os.walk(config_dir):
+            for name in filenames:
+                try:
+                    latest = max(latest, os.stat(os.path.join(dirpath, name)).st_mtime_ns)
+                except OSError:
+                    continue
+        return latest
+    for name in _BENGAL_CONFIG_NAMES:
+        try:
+            return (root / name).stat().st_mtime_ns
+        except OSError:
             continue
-        page.html_content = md(raw)
+    return 0
+
+
+def _clear_site_cache() -> None:
+    """Drop all memoized sites, forcing the next load to rebuild."""
+    with _site_cache_lock:
+        _site_cache.clear()
+
+
+def _load_site(root: Path, *, reuse: bool = True) -> Site:
+    """Load a Bengal site, reusing an earlier load while its config is unchanged.
+
+    ``build`` and ``serve`` both start by loading the site; when one
+    process runs several of them against the same root, only the first
+    pays for discovery and parsing.  Loads are keyed by the resolved root
+    and the config's modification time (:func:`_config_mtime_ns`), so a
+    config edit forces a fresh load.  Edits to ``content/``, ``data/`` or
+    other sources are not detected: the dev watcher clears the cache on
+    config changes, and :func:`_clear_site_cache` drops it explicitly.
+
+    Pass ``reuse=False`` when the caller will mutate the site (``dev``
+    updates pages in place): the load neither reads nor populates the
+    cache, so no other entry point sees those edits.
+
+    Raises:
+        ConfigError: If the site cannot be loaded (missing config, bad structure).
+
+    """
+    if not reuse:
+        return _load_site_uncached(root)
+
+    key = root.resolve()
+    stamp = _config_mtime_ns(key)
+    with _site_cache_lock:
+        cached = _site_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    site = _load_site_uncached(root)
+
+    with _site_cache_lock:
+        _site_cache.pop(key, None)
+        _site_cache[key] = (stamp, site)
+        while len(_site_cache) > _SITE_CACHE_SIZE:
+            del _site_cache[next(iter(_site_cache))]
+    return site
 
 
-def _load_site(root: Path) -> Site:
+def _load_site_uncached(root: Path) -> Site:
     """Load a Bengal site from the given root directory.
 
     Loads configuration via ``Site.from_config()`` and then discovers
@@ -75,6 +197,11 @@ def _load_site(root: Path) -> Site:
         raise ConfigError(msg) from exc
 
 
+# Compiled templates kept per environment.  Above Kida's default so a
+# large theme plus chirp-ui partials never evicts during a build or serve.
+_TEMPLATE_CACHE_SIZE = 1000
+
+
 def _create_chirp_app(config: PurrConfig, *, debug: bool = False) -> App:
     """Create a Chirp App configured for the Purr site.
 
@@ -82,15 +209,18 @@ def _create_chirp_app(config: PurrConfig, *, debug: bool = False) -> App:
     default theme fills the gaps.  Template directories are resolved via
     ``purr.theme.get_template_dirs()``.
 
-    Chirp's ``AppConfig.template_dir`` only accepts a single path, so we
-    patch ``create_environment`` to construct a Kida ``FileSystemLoader``
-    with multiple paths (which Kida natively supports).
+    Chirp's ``AppConfig.template_dir`` only accepts a single path, so the
+    app is handed a ready-made Kida environment (:func:`_create_environment`)
+    whose loader searches every directory.  Chirp binds the app's filters
+    and globals to it at freeze time.
+
+    Template auto-reload follows *debug*: only ``dev`` checks templates
+    for changes, ``build`` and ``serve`` serve compiled templates straight
+    from the cache.
 
     """
     from chirp import App, AppConfig
 
-    from purr.theme import get_template_dirs
-
     template_dirs = get_template_dirs(config)
 
     # Pass the first dir to AppConfig (Chirp expects str | Path).
@@ -101,73 +231,204 @@ def _create_chirp_app(config: PurrConfig, *, debug: bool = False) -> App:
         port=config.port,
     )
 
-    # Patch Chirp's env creation to use Kida's multi-path loader.
-    # Kida's FileSystemLoader natively supports a list of paths, but
-    # Chirp's create_environment() stringifies the single path.
-    #
-    # Chirp's app.py binds ``create_environment`` via a ``from`` import,
-    # so we must patch the name in ``chirp.app`` directly.  The patch is
-    # guard-claused: it only activates when ``cfg.template_dir`` matches
-    # the Purr app's primary template dir.  For any other App the
-    # original function is called, preventing leakage in tests.
-    import chirp.app as _chirp_app
-
-    _orig_create_env = _chirp_app.create_environment
-    _primary_dir = str(template_dirs[0])
-
-    def _create_env_guarded(
-        cfg: object, filters: dict, globals_: dict,
-    ) -> object:
-        # Only apply multi-path loading for the Purr-managed app.
-        if str(getattr(cfg, "template_dir", None)) != _primary_dir:
-            return _orig_create_env(cfg, filters, globals_)
-
-        from kida import ChoiceLoader, Environment, FileSystemLoader, PackageLoader
-
-        loaders: list[FileSystemLoader | PackageLoader] = [
-            FileSystemLoader(template_dirs),
-        ]
-        # Chirp's built-in macros
-        loaders.append(PackageLoader("chirp.templating", "macros"))
-        # chirp-ui if installed
-        try:
-            import chirp_ui  # noqa: F401
+    app = App(
+        config=app_config,
+        kida_env=_create_environment(app_config, tuple(template_dirs)),
+    )
 
-            loaders.append(PackageLoader("chirp_ui", "templates"))
+    # chirp-ui integration when installed
+    chirp_ui = _chirp_ui()
+    if chirp_ui is not None:
+        try:
+            from chirp.ext.chirp_ui import use_chirp_ui
         except ImportError:
-            pass
-
-        env = Environment(
-            loader=ChoiceLoader(loaders),
-            autoescape=cfg.autoescape,  # type: ignore[attr-defined]
-            auto_reload=cfg.debug,  # type: ignore[attr-defined]
-            trim_blocks=cfg.trim_blocks,  # type: ignore[attr-defined]
-            lstrip_blocks=cfg.lstrip_blocks,  # type: ignore[attr-defined]
-        )
-        from chirp.templating.filters import BUILTIN_FILTERS
+            pass  # Chirp release without the chirp-ui extension
+        else:
+            use_chirp_ui(app)
+            chirp_ui.register_filters(app)
+
+    return app
 
-        env.update_filters(BUILTIN_FILTERS)
-        if filters:
-            env.update_filters(filters)
-        for name, value in globals_.items():
-            env.add_global(name, value)
-        return env
 
-    _chirp_app.create_environment = _create_env_guarded  # type: ignore[assignment]
+@functools.cache
+def _chirp_ui() -> ModuleType | None:
+    """Return the optional ``chirp_ui`` module, or None if not installed.
 
-    app = App(config=app_config)
+    Resolved once per process.  A failed import is not recorded in
+    ``sys.modules``, so without the cache every app creation would repeat
+    the full module search and raise ``ImportError`` again.
 
-    # chirp-ui integration when installed
+    """
     try:
-        import chirp_ui as _chirp_ui
-        from chirp.ext.chirp_ui import use_chirp_ui
-
-        use_chirp_ui(app)
-        _chirp_ui.register_filters(app)
+        import chirp_ui
     except ImportError:
-        pass
+        return None
+    return chirp_ui
 
-    return app
+
+def _create_environment(app_config: AppConfig, template_dirs: tuple[Path, ...]) -> Environment:
+    """Create the Kida environment for one Purr app.
+
+    Mirrors Chirp's ``create_environment()`` but searches all of
+    *template_dirs*, sizes the template cache for a whole theme, and
+    shares compiled template code with every other Purr app in the process
+    (:func:`_template_code_cache`).  The app's own filters and globals are
+    added by Chirp when it freezes.
+
+    """
+    from chirp.templating.filters import BUILTIN_FILTERS
+    from kida import Environment
+
+    env = Environment(
+        loader=_template_loader(template_dirs),
+        autoescape=app_config.autoescape,
+        # Only dev re-stats templates on load; build/serve never reload
+        auto_reload=app_config.debug,
+        cache_size=_TEMPLATE_CACHE_SIZE,
+        trim_blocks=app_config.trim_blocks,
+        lstrip_blocks=app_config.lstrip_blocks,
+        bytecode_cache=_template_code_cache(),
+    )
+    env.update_filters(BUILTIN_FILTERS)
+    return env
+
+
+@functools.cache
+def _template_code_cache() -> MemoryBytecodeCache:
+    """Return the process-wide cache of compiled template code.
+
+    Environments are per app, but an unchanged template compiles to the
+    same code in all of them: Purr creates every ``AppConfig`` with Chirp's
+    default escaping and whitespace settings.  Sharing the code means a
+    second app in the process (``build`` then ``serve``, tests) only
+    re-parses templates instead of compiling them again.
+
+    """
+    from purr._bytecode import MemoryBytecodeCache
+
+    return MemoryBytecodeCache()
+
+
+@functools.lru_cache(maxsize=8)
+def _template_loader(template_dirs: tuple[Path, ...]) -> ChoiceLoader:
+    """Return the Kida loader chain for *template_dirs*, built once per chain.
+
+    Theme templates first, then Chirp's built-in macros, then chirp-ui's
+    templates when it is installed.  Kida loaders hold only their search
+    roots, so one chain is shared by every environment over the same
+    directories — saving the path resolution and the chirp-ui import probe
+    when several apps are created in one process (tests, build + serve).
+
+    The environment itself is not shared: it binds each app's own template
+    globals (``site``, navigation) and filters.
+
+    """
+    from kida import ChoiceLoader, FileSystemLoader, PackageLoader
+
+    loaders: list[FileSystemLoader | PackageLoader] = [
+        FileSystemLoader(list(template_dirs)),
+    ]
+    # Chirp's built-in macros
+    loaders.append(PackageLoader("chirp.templating", "macros"))
+    # chirp-ui if installed
+    if _chirp_ui() is not None:
+        loaders.append(PackageLoader("chirp_ui", "templates"))
+    return ChoiceLoader(loaders)
+
+
+class _Startup(NamedTuple):
+    """Result of :func:`_load_startup`."""
+
+    site: Site
+    app: App
+    route_defs: tuple[RouteDefinition, ...]
+
+
+def _load_startup(
+    config: PurrConfig,
+    *,
+    debug: bool = False,
+    publish: bool = False,
+    reuse_site: bool = True,
+) -> _Startup:
+    """Load the site, create the Chirp app, and discover dynamic routes concurrently.
+
+    Site loading is mostly disk I/O and Markdown parsing, app creation
+    mostly imports, and route discovery scans ``routes/`` and imports the
+    handler modules.  Site loading and route discovery run on helper
+    threads while the calling thread creates the app, so startup costs
+    roughly the longest step rather than their sum.  Routes are only
+    discovered here; registering them on the app is left to
+    :func:`_wire_dynamic_routes`.
+
+    With *publish* (``dev`` and ``serve``) the site is passed to
+    ``purr._set_site()`` as soon as it loads, and route discovery waits
+    for that: route modules may read ``purr.site`` at import time.
+    *reuse_site* is passed to :func:`_load_site`; ``dev`` turns it off
+    because it edits the loaded pages in place.
+
+    Failures are raised in the order the steps used to run one after the
+    other: site, then app, then routes.
+
+    Raises:
+        ConfigError: If the site cannot be loaded.
+
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from purr import _set_site
+
+    def publish_then_discover() -> tuple[RouteDefinition, ...]:
+        _set_site(site_future.result())
+        return discover_routes(config.routes_path)
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="purr-load") as pool:
+        site_future = pool.submit(_load_site, config.root, reuse=reuse_site)
+        if publish:
+            routes_future = pool.submit(publish_then_discover)
+        else:
+            routes_future = pool.submit(discover_routes, config.routes_path)
+        try:
+            app = _create_chirp_app(config, debug=debug)
+        finally:
+            site = site_future.result()
+        route_defs = routes_future.result()
+    return _Startup(site, app, route_defs)
+
+
+def _precompile_templates(app: App, config: PurrConfig) -> None:
+    """Compile every theme template into Kida's cache before the first request.
+
+    Chirp renders ``Template(name, ...)`` through the Kida environment's
+    template cache, so once a template is compiled each render is a cache
+    lookup.  The environment only exists after the app freezes (ASGI
+    lifespan startup), so the warm-up runs as an ``on_startup`` hook —
+    still before the server accepts its first request.
+
+    Templates that fail to compile are skipped here; the error surfaces on
+    first render where the dev error overlay can show it.
+
+    """
+    @app.on_startup
+    async def _warm_template_cache() -> None:
+        kida_env = getattr(app, "_kida_env", None)
+        if kida_env is None:
+            return
+
+        seen: set[str] = set()
+        for template_dir in get_template_dirs(config):
+            for name in list_template_names(template_dir):
+                if name in seen:
+                    continue  # Overridden by a higher-priority theme dir
+                seen.add(name)
+                try:
+                    kida_env.get_template(name)
+                except Exception:
+                    continue
+
+
+# Resolved auth_load_user callables keyed by (module file, mtime, attr)
+_load_user_cache: dict[tuple[Path, int, str], object] = {}
 
 
 def _resolve_load_user(config: PurrConfig) -> object | None:
@@ -175,6 +436,9 @@ def _resolve_load_user(config: PurrConfig) -> object | None:
 
     Format: ``module:attr`` (e.g. ``auth:load_user`` for routes/auth.py).
     Returns the callable or None if not configured.
+
+    The module is executed once per file version; later calls (another
+    app in the same process) return the same callable.
     """
     spec = config.auth_load_user
     if not spec or ":" not in spec:
@@ -183,9 +447,19 @@ def _resolve_load_user(config: PurrConfig) -> object | None:
     if not module_part or not attr:
         return None
     py_file = config.routes_path / f"{module_part}.py"
-    if not py_file.is_file():
+    # One stat answers both "is it a file" and "which version" — a cache
+    # hit costs no other filesystem access
+    try:
+        st = py_file.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         msg = f"auth_load_user {spec!r}: {py_file} not found"
         raise ConfigError(msg)
+    key = (py_file.absolute(), st.st_mtime_ns, attr)
+    cached = _load_user_cache.get(key)
+    if cached is not None:
+        return cached
     module_name = f"purr_auth_{module_part}"
     spec_obj = importlib.util.spec_from_file_location(module_name, py_file)
     if spec_obj is None or spec_obj.loader is None:
@@ -198,6 +472,7 @@ def _resolve_load_user(config: PurrConfig) -> object | None:
     if not callable(callable_obj):
         msg = f"auth_load_user {spec!r}: {attr} not callable in {py_file}"
         raise ConfigError(msg)
+    _load_user_cache[key] = callable_obj
     return callable_obj
 
 
@@ -228,23 +503,29 @@ def _wire_auth_middleware(app: App, config: PurrConfig) -> None:
 
 def _wire_template_globals(site: Site, app: App) -> None:
     """Inject site and nav_sections into template globals for all templates."""
+    from purr.content.router import _nav_sections
+
     app._template_globals["site"] = site
-    app._template_globals["nav_sections"] = [
-        {"title": s.title or s.name, "href": getattr(s, "href", f"/{s.name}/")}
-        for s in site.sections
-        if getattr(s, "title", None) or getattr(s, "name", None)
-    ]
+    app._template_globals["nav_sections"] = _nav_sections(site.sections)
+
+
+class _WiredContent(NamedTuple):
+    """Result of :func:`_wire_content_routes`."""
+
+    router: ContentRouter
+    page_count: int
 
 
 def _wire_content_routes(
     site: Site, app: App, config: PurrConfig
-) -> tuple[ContentRouter, int]:
+) -> _WiredContent:
     """Register Bengal content pages as Chirp routes.
 
     When config.auth is True, pages with gated metadata (config.gated_metadata_key)
     are wrapped with @login_required.
 
-    Returns the ContentRouter instance and the number of pages registered.
+    Returns the ContentRouter instance and the number of pages registered
+    as a :class:`_WiredContent`.
 
     Raises:
         ContentError: If route registration fails.
@@ -255,7 +536,7 @@ def _wire_content_routes(
     try:
         router = ContentRouter(site, app, config)
         router.register_pages()
-        return router, router.page_count
+        return _WiredContent(router, router.page_count)
     except Exception as exc:
         msg = f"Failed to register content routes: {exc}"
         raise ContentError(msg) from exc
@@ -269,19 +550,53 @@ def _mount_static_files(app: App, config: PurrConfig) -> None:
     via use_chirp_ui() in _create_chirp_app when chirp-ui is installed.
     All served under ``/static``. User files take precedence.
 
+    Missing directories are skipped, as are empty ones outside dev mode.
+    Several directories are mounted as one
+    :class:`~purr._static.StaticFilesChain` middleware.
+    Outside dev mode file responses are also cached in memory
+    (:class:`~purr._static.CachedStaticFiles`).
+
     """
     from chirp.middleware import StaticFiles
 
-    from purr.theme import get_asset_dirs
+    # Outside dev mode the file set is fixed: an empty directory can never
+    # serve anything, so skip it rather than add a middleware layer that
+    # stats every /static request, and reuse each file's response instead
+    # of re-reading it.  Dev keeps both so files added or edited while the
+    # server runs are picked up.
+    if app.config.debug:
+        static_cls, has_files = StaticFiles, Path.is_dir
+    else:
+        from purr._static import CachedStaticFiles
+
+        static_cls, has_files = CachedStaticFiles, _has_assets
+
+    members = [
+        static_cls(directory=asset_dir, prefix="/static")
+        for asset_dir in get_asset_dirs(config)
+        if has_files(asset_dir)
+    ]
+    if len(members) > 1:
+        from purr._static import StaticFilesChain
+
+        app.add_middleware(StaticFilesChain(members, prefix="/static"))
+    elif members:
+        app.add_middleware(members[0])
 
-    for asset_dir in get_asset_dirs(config):
-        if asset_dir.is_dir():
-            app.add_middleware(StaticFiles(directory=asset_dir, prefix="/static"))
+
+def _has_assets(directory: Path) -> bool:
+    """Return True if *directory* exists and has at least one entry."""
+    try:
+        with os.scandir(directory) as it:
+            return next(it, None) is not None
+    except OSError:
+        return False
 
 
 def _wire_dynamic_routes(
     app: App,
     config: PurrConfig,
+    definitions: tuple[RouteDefinition, ...] | None = None,
 ) -> tuple[RouteDefinition, ...]:
     """Discover and register user-defined routes from the ``routes/`` directory.
 
@@ -289,15 +604,18 @@ def _wire_dynamic_routes(
     and registers each as a Chirp route.  Also injects navigation entries into
     Chirp's template globals so templates can render nav links for dynamic routes.
 
+    Pass *definitions* when the routes were already discovered (see
+    :func:`_load_startup`) to skip the scan.
+
     Returns an empty tuple if the routes directory does not exist.
 
     """
-    from purr.routes.loader import build_nav_entries, discover_routes
-
-    definitions = discover_routes(config.routes_path)
+    if definitions is None:
+        definitions = discover_routes(config.routes_path)
 
+    route = app.route
     for defn in definitions:
-        app.route(
+        route(
             defn.path,
             methods=list(defn.methods),
             name=defn.name,
@@ -312,42 +630,83 @@ def _wire_dynamic_routes(
     return definitions
 
 
+@functools.cache
+def _effect_tracer_cls() -> type | None:
+    """Return Bengal's ``EffectTracer`` class, or None if unavailable.
+
+    Resolved once per process.  A failed import is not recorded in
+    ``sys.modules``, so without the cache every dev startup would repeat
+    the full module search when the optional module is missing.
+
+    """
+    try:
+        from bengal.effects import EffectTracer
+    except Exception:
+        return None
+    return EffectTracer
+
+
+class _ReactiveSetup(NamedTuple):
+    """Result of :func:`_setup_reactive_pipeline`."""
+
+    broadcaster: Broadcaster
+    pipeline: ReactivePipeline
+    collector: StackCollector
+
+
+@functools.cache
+def _stack_collector() -> StackCollector:
+    """Return the process-wide ``StackCollector`` and its ``EventLog``.
+
+    Created on first use and shared by everything in the process that
+    records events — the reactive pipeline and Pounce's lifecycle hooks.
+    Forked serve workers each inherit their own copy.  The event log is a
+    bounded ring buffer, so sharing it across runs cannot grow without
+    limit.
+
+    """
+    from purr.observability import EventLog, StackCollector
+
+    return StackCollector(EventLog())
+
+
 def _setup_reactive_pipeline(
     site: Site,
     app: App,
     config: PurrConfig,
     router: ContentRouter,
-) -> tuple[Broadcaster, object, object]:
+) -> _ReactiveSetup:
     """Set up the reactive pipeline for dev mode.
 
     Creates the broadcaster, dependency graph, mapper, pipeline coordinator,
     registers the SSE endpoint, and adds the HMR middleware.
 
-    Returns the Broadcaster, ReactivePipeline, and StackCollector instances.
+    Returns the Broadcaster, ReactivePipeline, and StackCollector instances
+    as a :class:`_ReactiveSetup`.
 
     """
-    from purr.observability import EventLog, StackCollector
-    from purr.reactive.broadcaster import Broadcaster
-    from purr.reactive.graph import DependencyGraph
-    from purr.reactive.hmr import hmr_middleware
-    from purr.reactive.mapper import ReactiveMapper
-    from purr.reactive.pipeline import ReactivePipeline
+    from purr.reactive import (
+        Broadcaster,
+        DependencyGraph,
+        ReactiveMapper,
+        ReactivePipeline,
+        error_overlay_middleware,
+        hmr_middleware,
+    )
 
     broadcaster = Broadcaster()
 
     # Build the dependency graph.  In dev mode, the EffectTracer may not
     # be populated yet (it's built during a full build).  We create a
     # lightweight tracer for reactive use.
+    tracer_cls = _effect_tracer_cls()
     try:
-        from bengal.effects import EffectTracer
-
-        tracer = EffectTracer()
+        tracer = tracer_cls() if tracer_cls is not None else None
     except Exception:
-        tracer = None  # type: ignore[assignment]
+        tracer = None
 
-    # Create the unified observability collector
-    event_log = EventLog()
-    collector = StackCollector(event_log)
+    # The process-wide unified observability collector
+    collector = _stack_collector()
 
     # DependencyGraph resolves kida_env lazily from the app reference
     # because the Kida environment isn't created until Chirp's _freeze().
@@ -361,25 +720,28 @@ def _setup_reactive_pipeline(
         collector=collector,
     )
 
-    # Pre-parse content to populate AST cache
-    pipeline.seed_ast_cache()
+    # Pre-parse content to populate the AST cache off the startup path, so
+    # the server starts accepting requests without waiting for every parse
+    threading.Thread(
+        target=pipeline.seed_ast_cache, name="purr-ast-seed", daemon=True,
+    ).start()
 
     # Register the SSE endpoint and stats endpoint
     router.register_sse_endpoint(broadcaster)
     router.register_stats_endpoint(collector)
 
     # Add error overlay middleware (catches render errors → styled HTML)
-    from purr.reactive.error_overlay import error_overlay_middleware
-
     app.add_middleware(error_overlay_middleware)
 
     # Add HMR script injection middleware
     app.add_middleware(hmr_middleware)
 
-    return broadcaster, pipeline, collector
+    return _ReactiveSetup(broadcaster, pipeline, collector)
 
 
-def _start_watcher(config: PurrConfig, pipeline: object, app: App) -> object:
+def _start_watcher(
+    config: PurrConfig, pipeline: ReactivePipeline, app: App
+) -> ContentWatcher:
     """Wire the ContentWatcher to the reactive pipeline via Chirp lifecycle hooks.
 
     Registers ``on_startup`` / ``on_shutdown`` hooks on *app* so that the
@@ -388,6 +750,7 @@ def _start_watcher(config: PurrConfig, pipeline: object, app: App) -> object:
     Flow:
         on_startup  → spawn ``_consume_events`` task (runs ``awatch`` internally)
         file change → async iteration → pipeline.handle_change()
+                      (config changes also clear the site cache)
         on_shutdown → cancel consumer task (cleanly tears down ``awatch``)
 
     Returns the ContentWatcher instance (for external reference, if needed).
@@ -396,7 +759,6 @@ def _start_watcher(config: PurrConfig, pipeline: object, app: App) -> object:
     import asyncio
 
     from purr.content.watcher import ContentWatcher
-    from purr.reactive.pipeline import ReactivePipeline
 
     watcher = ContentWatcher(config)
     _task: asyncio.Task[None] | None = None
@@ -406,8 +768,10 @@ def _start_watcher(config: PurrConfig, pipeline: object, app: App) -> object:
         nonlocal _task
 
         async def _consume_events() -> None:
-            assert isinstance(pipeline, ReactivePipeline)
             async for event in watcher.changes():
+                if event.category == "config":
+                    # Later loads in this process must re-read the config
+                    _clear_site_cache()
                 try:
                     await pipeline.handle_change(event)
                 except Exception as exc:
@@ -423,6 +787,38 @@ def _start_watcher(config: PurrConfig, pipeline: object, app: App) -> object:
     return watcher
 
 
+def _auto_workers() -> int:
+    """Worker count for ``workers=0``: usable CPUs, capped by cgroup quota.
+
+    Pounce's own auto-detect uses ``os.cpu_count()`` — the host's CPUs —
+    which oversubscribes containers with CPU limits or pinned affinity.
+
+    """
+    return usable_cpu_count()
+
+
+def _freeze_for_fork(workers: int) -> bool:
+    """Move the loaded site and app out of the GC's reach before forking.
+
+    On GIL builds Pounce runs multiple workers as forked processes.  Each
+    collector pass in a worker writes to the GC header of every tracked
+    object it visits, copying the parent's pages — and the page graph
+    with them — into every worker.  ``gc.freeze()`` moves everything
+    allocated so far into a permanent generation the collector skips, so
+    those pages stay shared.  Thread workers (free-threaded builds) and a
+    single worker already share one heap, so nothing is done.
+
+    Returns True if the heap was frozen.
+
+    """
+    if workers <= 1 or not gil_enabled():
+        return False
+    # Collect first so garbage from startup isn't pinned for the process lifetime
+    gc.collect()
+    gc.freeze()
+    return True
+
+
 # ---------------------------------------------------------------------------
 # Public entry points
 # ---------------------------------------------------------------------------
@@ -440,43 +836,46 @@ def dev(root: str | Path = ".", **kwargs: object) -> None:
         **kwargs: Override PurrConfig fields.
 
     """
-    from purr import _set_site
     from purr.banner import print_banner
+    from purr.config_loader import load_config
 
     config = load_config(Path(root), **kwargs)
     t0 = time.perf_counter()
+    reset_stages()
 
-    # Load Bengal site and make it available via purr.site
-    site = _load_site(config.root)
-    _set_site(site)
+    # Load Bengal site (made available via purr.site) and discover dynamic
+    # routes while creating the Chirp app with debug enabled
+    with stage("load"):
+        site, app, route_defs = _load_startup(config, debug=True, publish=True, reuse_site=False)
 
-    # Create Chirp app with debug enabled
-    app = _create_chirp_app(config, debug=True)
-    _wire_auth_middleware(app, config)
+    with stage("wire"):
+        _precompile_templates(app, config)
+        _wire_auth_middleware(app, config)
 
-    # Wire content routes
-    router, page_count = _wire_content_routes(site, app, config)
+        # Wire content routes
+        wired = _wire_content_routes(site, app, config)
 
-    # Inject site and nav_sections for all templates (including dynamic routes)
-    _wire_template_globals(site, app)
+        # Inject site and nav_sections for all templates (including dynamic routes)
+        _wire_template_globals(site, app)
 
-    # Wire dynamic routes from routes/ directory
-    dynamic_defs = _wire_dynamic_routes(app, config)
+        # Wire dynamic routes from routes/ directory
+        dynamic_defs = _wire_dynamic_routes(app, config, route_defs)
 
-    # Set up reactive pipeline (SSE endpoint, HMR middleware, watcher)
-    _broadcaster, pipeline, collector = _setup_reactive_pipeline(site, app, config, router)
+    with stage("reactive"):
+        # Set up reactive pipeline (SSE endpoint, HMR middleware, watcher)
+        reactive = _setup_reactive_pipeline(site, app, config, wired.router)
 
-    # Mount static files
-    _mount_static_files(app, config)
+        # Mount static files
+        _mount_static_files(app, config)
 
-    # Wire file watcher → reactive pipeline (starts on app startup)
-    _start_watcher(config, pipeline, app)
+        # Wire file watcher → reactive pipeline (starts on app startup)
+        _start_watcher(config, reactive.pipeline, app)
 
     load_ms = (time.perf_counter() - t0) * 1000
 
     # Banner
     print_banner(
-        config, page_count, mode="dev",
+        config, wired.page_count, mode="dev",
         route_count=len(dynamic_defs), reactive=True,
         load_ms=load_ms,
     )
@@ -485,7 +884,7 @@ def dev(root: str | Path = ".", **kwargs: object) -> None:
     # Pass the StackCollector as Pounce's lifecycle_collector so
     # connection events flow into the same EventLog as pipeline events.
     # Watcher shutdown is handled by the on_shutdown hook registered above.
-    app.run(host=config.host, port=config.port, lifecycle_collector=collector)
+    app.run(host=config.host, port=config.port, lifecycle_collector=reactive.collector)
 
 
 def build(root: str | Path = ".", **kwargs: object) -> None:
@@ -501,26 +900,29 @@ def build(root: str | Path = ".", **kwargs: object) -> None:
 
     """
     from purr.banner import print_banner
+    from purr.config_loader import load_config
     from purr.export.static import StaticExporter
 
     config = load_config(Path(root), **kwargs)
     t0 = time.perf_counter()
+    reset_stages()
 
-    # Load Bengal site
-    site = _load_site(config.root)
+    # Load Bengal site and discover dynamic routes while creating the Chirp
+    # app for template rendering
+    with stage("load"):
+        site, app, route_defs = _load_startup(config)
 
-    # Create Chirp app for template rendering
-    app = _create_chirp_app(config)
-    _wire_auth_middleware(app, config)
+    with stage("wire"):
+        _wire_auth_middleware(app, config)
 
-    # Wire content routes (needed for template resolution)
-    _router, page_count = _wire_content_routes(site, app, config)
+        # Wire content routes (needed for template resolution)
+        page_count = _wire_content_routes(site, app, config).page_count
 
-    # Inject site and nav_sections for all templates
-    _wire_template_globals(site, app)
+        # Inject site and nav_sections for all templates
+        _wire_template_globals(site, app)
 
-    # Discover dynamic routes
-    dynamic_defs = _wire_dynamic_routes(app, config)
+        # Register dynamic routes
+        dynamic_defs = _wire_dynamic_routes(app, config, route_defs)
 
     load_ms = (time.perf_counter() - t0) * 1000
 
@@ -538,32 +940,34 @@ def build(root: str | Path = ".", **kwargs: object) -> None:
         config=config,
         routes=dynamic_defs,
     )
-    result = exporter.export()
+    with stage("export"):
+        result = exporter.export()
 
     # Print summary
     _print_export_summary(result)
 
 
+# Export summary pieces; ``_PLURAL[n != 1]`` picks the noun suffix
+_SUMMARY_RULE = "─" * 41
+_PLURAL = ("", "s")
+
+
 def _print_export_summary(result: object) -> None:
     """Print export completion summary to stderr."""
+    from purr.banner import write_stderr
     from purr.export.static import ExportResult
 
     if not isinstance(result, ExportResult):
         return
 
-    lines = [
-        "",
-        "─" * 41,
-        f"  Exported {result.total_pages} page{'s' if result.total_pages != 1 else ''}",
-    ]
-    if result.total_assets > 0:
-        lines.append(
-            f"  Copied {result.total_assets} asset{'s' if result.total_assets != 1 else ''}"
-        )
-    lines.append(f"  Output: {result.output_dir}")
-    lines.append(f"  Done in {result.duration_ms:.0f}ms")
+    pages = result.total_pages
+    assets = result.total_assets
+    summary = f"\n{_SUMMARY_RULE}\n  Exported {pages} page{_PLURAL[pages != 1]}\n"
+    if assets > 0:
+        summary += f"  Copied {assets} asset{_PLURAL[assets != 1]}\n"
+    summary += f"  Output: {result.output_dir}\n  Done in {result.duration_ms:.0f}ms\n"
 
-    print("\n".join(lines), file=sys.stderr)
+    write_stderr(summary)
 
 
 def serve(root: str | Path = ".", **kwargs: object) -> None:
@@ -572,38 +976,41 @@ def serve(root: str | Path = ".", **kwargs: object) -> None:
     Static content is served via Chirp routes.  Dynamic routes from
     ``routes/`` are discovered and handled per-request.  Multiple Pounce
     workers share the frozen Chirp app and immutable Bengal site data —
-    no shared mutable state.
+    no shared mutable state.  When workers are forked processes the heap
+    is frozen first so the site stays on copy-on-write shared pages.
 
     Args:
         root: Path to the site root directory.
         **kwargs: Override PurrConfig fields.
 
     """
-    from purr import _set_site
     from purr.banner import print_banner
+    from purr.config_loader import load_config
 
     config = load_config(Path(root), **kwargs)
     t0 = time.perf_counter()
+    reset_stages()
 
-    # Load Bengal site and make it available via purr.site
-    site = _load_site(config.root)
-    _set_site(site)
+    # Load Bengal site (made available via purr.site) and discover dynamic
+    # routes while creating the Chirp app (production mode — no debug, no reload)
+    with stage("load"):
+        site, app, route_defs = _load_startup(config, debug=False, publish=True)
 
-    # Create Chirp app (production mode — no debug, no reload)
-    app = _create_chirp_app(config, debug=False)
-    _wire_auth_middleware(app, config)
+    with stage("wire"):
+        _precompile_templates(app, config)
+        _wire_auth_middleware(app, config)
 
-    # Wire content routes
-    _router, page_count = _wire_content_routes(site, app, config)
+        # Wire content routes
+        page_count = _wire_content_routes(site, app, config).page_count
 
-    # Inject site and nav_sections for all templates
-    _wire_template_globals(site, app)
+        # Inject site and nav_sections for all templates
+        _wire_template_globals(site, app)
 
-    # Wire dynamic routes from routes/ directory
-    dynamic_defs = _wire_dynamic_routes(app, config)
+        # Wire dynamic routes from routes/ directory
+        dynamic_defs = _wire_dynamic_routes(app, config, route_defs)
 
-    # Mount static files
-    _mount_static_files(app, config)
+        # Mount static files
+        _mount_static_files(app, config)
 
     load_ms = (time.perf_counter() - t0) * 1000
 
@@ -614,20 +1021,19 @@ def serve(root: str | Path = ".", **kwargs: object) -> None:
         load_ms=load_ms,
     )
 
-    # Create observability collector for production mode
-    from purr.observability import EventLog, StackCollector
-
-    event_log = EventLog()
-    collector = StackCollector(event_log)
+    # Observability collector for production mode
+    collector = _stack_collector()
 
     # Run via Pounce directly with multi-worker support
     from pounce.config import ServerConfig
     from pounce.server import Server
 
+    workers = config.workers or _auto_workers()
     server_config = ServerConfig(
         host=config.host,
         port=config.port,
-        workers=config.workers,  # 0 = auto-detect via Pounce
+        workers=workers,
     )
+    _freeze_for_fork(workers)
     server = Server(server_config, app, lifecycle_collector=collector)
     server.run()
@@ -6,9 +6,12 @@ Bengal cat mascot.  Detects ``NO_COLOR`` / ``TERM`` for safe fallback.
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
+
+from purr import __version__
 
 if TYPE_CHECKING:
     from purr.config import PurrConfig
@@ -19,53 +22,147 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 def _supports_color() -> bool:
-    """Return True if the terminal supports ANSI colors."""
+    """Return True if the terminal supports ANSI colors.
+
+    Cheap checks run first (``NO_COLOR``, ``TERM=dumb``, ``isatty()``);
+    terminfo is consulted only for a TTY, and only rules color out when
+    it reports fewer than 8 colors (e.g. ``xterm-mono``).
+
+    """
     if os.environ.get("NO_COLOR"):
         return False
     if os.environ.get("TERM") == "dumb":
         return False
-    return hasattr(sys.stderr, "isatty") and sys.stderr.isatty()
+    if not (hasattr(sys.stderr, "isatty") and sys.stderr.isatty()):
+        return False
+    colors = _terminal_colors()
+    return colors is None or colors >= 8
+
+
+def _terminal_colors() -> int | None:
+    """Return terminfo's color count for stderr, or None if unknown.
+
+    None covers Windows, Pythons without ``curses``, and terminals
+    missing from the terminfo database.  A terminal that lacks the
+    ``colors`` capability reports -1 (monochrome).
 
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import curses
+
+        curses.setupterm(fd=sys.stderr.fileno())
+        return curses.tigetnum("colors")
+    except Exception:
+        return None
+
+
+# Fixed banner pieces
+_CAT = "\u14DA\u1618\u14E2"  # ᓚᘏᗢ
+_RULE_LINE = "─" * 43
 
-_COLOR = _supports_color()
+# reset, bold, dim, cyan, green, yellow, orange
+_ANSI = ("\033[0m", "\033[1m", "\033[2m", "\033[36m", "\033[32m", "\033[33m", "\033[38;5;214m")
 
-_RESET = "\033[0m" if _COLOR else ""
-_BOLD = "\033[1m" if _COLOR else ""
-_DIM = "\033[2m" if _COLOR else ""
-_CYAN = "\033[36m" if _COLOR else ""
-_GREEN = "\033[32m" if _COLOR else ""
-_YELLOW = "\033[33m" if _COLOR else ""
-_MAGENTA = "\033[35m" if _COLOR else ""
-_ORANGE = "\033[38;5;214m" if _COLOR else ""
+
+class _Palette(NamedTuple):
+    """ANSI escapes for the banner — all empty when color is off.
+
+    The fixed line prefixes are styled here once, so ``print_banner``
+    only formats the parts that vary.
+
+    """
+
+    enabled: bool
+    reset: str
+    bold: str
+    dim: str
+    cyan: str
+    green: str
+    yellow: str
+    orange: str
+    rule: str
+    branch: str
+    leaf: str
+    logo: str
+
+
+@functools.cache
+def _palette() -> _Palette:
+    """Return the banner palette, detecting color support on first use.
+
+    Deferred from import to the first banner, so processes that never
+    print one (``purr --help``, callers that only need
+    :func:`write_stderr`) skip the environment and ``isatty()`` checks.
+
+    """
+    enabled = _supports_color()
+    reset, bold, dim, cyan, green, yellow, orange = _ANSI if enabled else ("",) * 7
+    return _Palette(
+        enabled, reset, bold, dim, cyan, green, yellow, orange,
+        rule=f"  {dim}{_RULE_LINE}{reset}",
+        branch=f"  {dim}├─{reset} ",
+        leaf=f"  {dim}└─{reset} ",
+        logo=f"  {orange}{bold}{_CAT}{reset}  Purr {dim}v{__version__}{reset}  ",
+    )
 
 
 # ---------------------------------------------------------------------------
 # Mode badges
 # ---------------------------------------------------------------------------
 
-_MODE_STYLES: dict[str, tuple[str, str]] = {
-    "dev": (_GREEN, "dev"),
-    "build": (_YELLOW, "build"),
-    "serve": (_CYAN, "serve"),
+# Mode -> palette field used for its badge
+_MODE_COLORS: dict[str, str] = {
+    "dev": "green",
+    "build": "yellow",
+    "serve": "cyan",
 }
 
 
-def _mode_badge(mode: str) -> str:
+def _mode_badge(mode: str, p: _Palette) -> str:
     """Return a styled [mode] badge."""
-    color, label = _MODE_STYLES.get(mode, (_DIM, mode))
-    return f"{color}[{label}]{_RESET}"
+    color = getattr(p, _MODE_COLORS.get(mode, "dim"))
+    return f"{color}[{mode}]{p.reset}"
 
 
 # ---------------------------------------------------------------------------
 # Clickable URL (OSC 8 hyperlink escape)
 # ---------------------------------------------------------------------------
 
-def _clickable_url(url: str) -> str:
+def _clickable_url(url: str, p: _Palette) -> str:
     """Wrap *url* in an OSC 8 hyperlink escape if the terminal supports it."""
-    if not _COLOR:
+    if not p.enabled:
         return url
     # OSC 8 ;; url ST  visible text  OSC 8 ;; ST
-    return f"\033]8;;{url}\033\\{_BOLD}{_CYAN}{url}{_RESET}\033]8;;\033\\"
+    return f"\033]8;;{url}\033\\{p.bold}{p.cyan}{url}{p.reset}\033]8;;\033\\"
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def write_stderr(text: str) -> None:
+    """Write *text* to stderr in one ``write(2)`` call when possible.
+
+    Bypasses the ``TextIOWrapper`` so the whole banner reaches the terminal
+    at once instead of interleaving with output from worker processes.
+    Also used for the ``build`` export summary.
+    Falls back to ``sys.stderr.write`` when stderr has no file descriptor
+    (e.g. replaced by a ``StringIO``).
+
+    """
+    stream = sys.stderr
+    try:
+        fd = stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        stream.write(text)
+        return
+    # Anything already buffered must go out first to keep ordering
+    stream.flush()
+    data = text.encode(getattr(stream, "encoding", None) or "utf-8", "replace")
+    while data:
+        data = data[os.write(fd, data):]
 
 
 # ---------------------------------------------------------------------------
@@ -94,57 +191,53 @@ def print_banner(
         warnings: Optional list of warning messages to display.
 
     """
-    from purr import __version__
-
-    # -- header --
-    cat = "\u14DA\u1618\u14E2"  # ᓚᘏᗢ
-    badge = _mode_badge(mode)
-    header = f"  {_ORANGE}{_BOLD}{cat}{_RESET}  Purr {_DIM}v{__version__}{_RESET}  {badge}"
+    p = _palette()
+    dim, reset, branch = p.dim, p.reset, p.branch
 
     lines: list[str] = [
         "",
-        header,
-        f"  {_DIM}{'─' * 43}{_RESET}",
+        p.logo + _mode_badge(mode, p),
+        p.rule,
     ]
 
     # -- status lines --
     pages_label = "page" if page_count == 1 else "pages"
-    timing = f" {_DIM}in {load_ms:.0f}ms{_RESET}" if load_ms > 0 else ""
-    lines.append(f"  {_DIM}├─{_RESET} {page_count} {pages_label} loaded{timing}")
+    timing = f" {dim}in {load_ms:.0f}ms{reset}" if load_ms > 0 else ""
+    lines.append(f"{branch}{page_count} {pages_label} loaded{timing}")
 
     if route_count > 0:
         routes_label = "route" if route_count == 1 else "routes"
-        lines.append(f"  {_DIM}├─{_RESET} {route_count} dynamic {routes_label}")
+        lines.append(f"{branch}{route_count} dynamic {routes_label}")
 
-    lines.append(f"  {_DIM}├─{_RESET} templates: {_DIM}{config.templates_path}{_RESET}")
+    lines.append(f"{branch}templates: {dim}{config.templates_path}{reset}")
 
     if reactive:
         lines.append(
-            f"  {_DIM}├─{_RESET} {_GREEN}live{_RESET} "
-            f"— SSE on {_DIM}/__purr/events{_RESET}"
+            f"{branch}{p.green}live{reset} "
+            f"— SSE on {dim}/__purr/events{reset}"
         )
 
     if mode == "build":
-        lines.append(f"  {_DIM}└─{_RESET} output: {_DIM}{config.output_path}{_RESET}")
+        lines.append(f"{p.leaf}output: {dim}{config.output_path}{reset}")
     elif mode == "serve":
         workers_label = str(config.workers) if config.workers > 0 else "auto"
-        lines.append(f"  {_DIM}├─{_RESET} workers: {workers_label}")
+        lines.append(f"{branch}workers: {workers_label}")
 
     # -- URL (dev / serve) --
     if mode in ("dev", "serve"):
         url = f"http://{config.host}:{config.port}"
         lines.append("")
-        lines.append(f"  {_clickable_url(url)}")
+        lines.append(f"  {_clickable_url(url, p)}")
 
     if mode == "dev":
         lines.append("")
-        lines.append(f"  {_DIM}Watching for changes...{_RESET}")
+        lines.append(f"  {dim}Watching for changes...{reset}")
 
     # -- warnings --
     if warnings:
         lines.append("")
-        lines.extend(f"  {_YELLOW}!{_RESET} {w}" for w in warnings)
+        lines.extend(f"  {p.yellow}!{reset} {w}" for w in warnings)
 
     lines.append("")
 
-    print("\n".join(lines), file=sys.stderr)
+    write_stderr("\n".join(lines) + "\n")
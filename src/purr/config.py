@@ -29,6 +29,14 @@ class PurrConfig:
             ``auth:load_user`` for routes/auth.py.
         session_secret: Secret key for session signing (required when auth=True).
         gated_metadata_key: Frontmatter key for gated content (default ``gated``).
+        watch_debounce_ms: Quiet period the dev watcher waits for before
+            delivering a burst of file changes as one batch.
+        content_path: Absolute path to content directory.
+        templates_path: Absolute path to templates directory.
+        static_path: Absolute path to static assets directory.
+        routes_path: Absolute path to user routes directory.
+        output_path: Absolute path to output directory (``output`` as-is
+            when already absolute).
 
     """
 
@@ -47,6 +55,15 @@ class PurrConfig:
     auth_load_user: str | None = None
     session_secret: str | None = None
     gated_metadata_key: str = "gated"
+    watch_debounce_ms: int = 75
+
+    # Absolute directory paths, joined once in __post_init__ rather than
+    # on every access.  Not init arguments; excluded from eq and hash.
+    content_path: Path = field(init=False, repr=False, compare=False)
+    templates_path: Path = field(init=False, repr=False, compare=False)
+    static_path: Path = field(init=False, repr=False, compare=False)
+    routes_path: Path = field(init=False, repr=False, compare=False)
+    output_path: Path = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         # Resolve root to absolute so that watchfiles (which returns
@@ -54,29 +71,14 @@ class PurrConfig:
         if not self.root.is_absolute():
             object.__setattr__(self, "root", self.root.resolve())
 
-    @property
-    def content_path(self) -> Path:
-        """Absolute path to content directory."""
-        return self.root / self.content_dir
-
-    @property
-    def templates_path(self) -> Path:
-        """Absolute path to templates directory."""
-        return self.root / self.templates_dir
-
-    @property
-    def static_path(self) -> Path:
-        """Absolute path to static assets directory."""
-        return self.root / self.static_dir
-
-    @property
-    def routes_path(self) -> Path:
-        """Absolute path to user routes directory."""
-        return self.root / self.routes_dir
-
-    @property
-    def output_path(self) -> Path:
-        """Absolute path to output directory."""
-        if self.output.is_absolute():
-            return self.output
-        return self.root / self.output
+        root = self.root
+        set_path = object.__setattr__
+        set_path(self, "content_path", root / self.content_dir)
+        set_path(self, "templates_path", root / self.templates_dir)
+        set_path(self, "static_path", root / self.static_dir)
+        set_path(self, "routes_path", root / self.routes_dir)
+        set_path(
+            self,
+            "output_path",
+            self.output if self.output.is_absolute() else root / self.output,
+        )
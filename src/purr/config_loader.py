@@ -1,14 +1,35 @@
 """Load PurrConfig from purr.yaml if present.
 
 Merges file config with CLI kwargs. CLI overrides file.
+Parsed files are cached by modification time and size, so repeated
+loads of an unchanged config skip the YAML/TOML parse.
 """
 
 from __future__ import annotations
 
+import stat
+import threading
 from pathlib import Path
 
 from purr.config import PurrConfig
 
+# Config file names in lookup order; the first regular file wins
+_CONFIG_NAMES = ("purr.yaml", "purr.yml", "purr.toml")
+
+# Keys also accepted at the top level of a config file, outside ``purr:``
+_TOP_LEVEL_KEYS = frozenset({
+    "auth", "auth_load_user", "session_secret", "gated_metadata_key",
+    "host", "port", "output", "base_url", "fingerprint",
+    "routes_dir", "content_dir", "templates_dir", "static_dir",
+    "watch_debounce_ms",
+})
+
+# Parsed config keyed by absolute file path -> ((mtime_ns, size), values).
+# Bounded like the route and site caches.
+_CONFIG_CACHE_SIZE = 8
+_config_cache: dict[Path, tuple[tuple[int, int], dict[str, object]]] = {}
+_config_cache_lock = threading.Lock()
+
 
 def load_config(root: Path, **overrides: object) -> PurrConfig:
     """Load PurrConfig from root, optionally merging purr.yaml.
@@ -25,25 +46,63 @@ def load_config(root: Path, **overrides: object) -> PurrConfig:
 
 
 def _read_purr_config(root: Path) -> dict[str, object]:
-    """Read purr config from yaml/toml if present. Returns empty dict otherwise."""
-    for name in ("purr.yaml", "purr.yml"):
+    """Read purr config from yaml/toml if present. Returns empty dict otherwise.
+
+    The parse is reused while the file's mtime and size are unchanged.
+    Callers get a fresh top-level dict, so merging into it cannot alter
+    the cached copy.
+
+    """
+    for name in _CONFIG_NAMES:
         path = root / name
-        if path.is_file():
-            return _parse_yaml(path)
-    toml_path = root / "purr.toml"
-    if toml_path.is_file():
-        return _parse_toml(toml_path)
+        # One stat serves both the is-file check and the cache stamp
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+
+        key = path.absolute()
+        stamp = (st.st_mtime_ns, st.st_size)
+        with _config_cache_lock:
+            cached = _config_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return dict(cached[1])
+
+        values = _parse_toml(path) if name == "purr.toml" else _parse_yaml(path)
+        with _config_cache_lock:
+            _config_cache.pop(key, None)
+            _config_cache[key] = (stamp, values)
+            while len(_config_cache) > _CONFIG_CACHE_SIZE:
+                del _config_cache[next(iter(_config_cache))]
+        return dict(values)
     return {}
 
 
 def _parse_yaml(path: Path) -> dict[str, object]:
-    """Parse YAML config. Returns empty dict on error."""
+    """Parse YAML config. Returns empty dict on error.
+
+    Uses libyaml's ``CSafeLoader`` when PyYAML was built with it (same
+    safe subset as ``yaml.safe_load``, parsed in C), else ``SafeLoader``.
+    Bytes are passed straight through; PyYAML detects the encoding.
+    A file with only blank and comment lines is ``{}`` without loading
+    PyYAML at all.
+
+    """
+    try:
+        buf = path.read_bytes()
+    except OSError:
+        return {}
+    if not _has_yaml_content(buf):
+        return {}
     try:
         import yaml
     except ImportError:
         return {}
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        data = yaml.safe_load(path.read_text()) or {}
+        data = yaml.load(buf, Loader=loader) or {}
     except Exception:
         return {}
     if not isinstance(data, dict):
@@ -51,6 +110,15 @@ def _parse_yaml(path: Path) -> dict[str, object]:
     return _flatten_purr_section(data)
 
 
+def _has_yaml_content(buf: bytes) -> bool:
+    """Return True if *buf* has any line that is not blank or a comment."""
+    for line in buf.splitlines():
+        line = line.strip()
+        if line and not line.startswith(b"#"):
+            return True
+    return False
+
+
 def _parse_toml(path: Path) -> dict[str, object]:
     """Parse TOML config. Returns empty dict on error."""
     try:
@@ -74,10 +142,6 @@ def _flatten_purr_section(data: dict[str, object]) -> dict[str, object]:
         for k, v in purr.items():
             result[k] = v
     for k, v in data.items():
-        if k != "purr" and k in (
-            "auth", "auth_load_user", "session_secret", "gated_metadata_key",
-            "host", "port", "output", "base_url", "fingerprint",
-            "routes_dir", "content_dir", "templates_dir", "static_dir",
-        ):
+        if k in _TOP_LEVEL_KEYS:
             result[k] = v
     return result
@@ -6,6 +6,7 @@ and AST diffing for the reactive pipeline.
 
 from purr.content.differ import ASTChange, diff_documents
 from purr.content.router import ContentRouter
+from purr.content.search import Hit, SearchIndex
 from purr.content.watcher import ChangeEvent, ContentWatcher
 
 __all__ = [
@@ -13,5 +14,7 @@ __all__ = [
     "ChangeEvent",
     "ContentRouter",
     "ContentWatcher",
+    "Hit",
+    "SearchIndex",
     "diff_documents",
 ]
@@ -10,16 +10,20 @@ with fast-path skipping of unchanged subtrees.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, NamedTuple
 
 from patitas.nodes import Block, Document
 
 
-@dataclass(frozen=True, slots=True)
-class ASTChange:
+class ASTChange(NamedTuple):
     """A single change between two AST trees.
 
+    A named tuple rather than a frozen dataclass: a large diff creates one
+    per changed node, and tuple construction skips the dataclass
+    ``__init__`` with its per-field ``object.__setattr__``.  As a tuple it
+    also unpacks, has a ``len()``, and compares equal to a plain tuple of
+    the same fields.
+
     Attributes:
         kind: Type of change — added, removed, or modified.
         path: Position in the tree as a tuple of child indices.
@@ -39,11 +43,12 @@ def diff_documents(old: Document, new: Document) -> tuple[ASTChange, ...]:
     """Structural diff on two Patitas Document trees.
 
     Returns a tuple of ASTChange objects describing the differences.
-    Unchanged subtrees are skipped in O(1) via ``==`` on frozen nodes.
+    Unchanged subtrees are skipped via ``==`` on frozen nodes, or by
+    identity when both trees share the node (e.g. incremental re-parses).
 
     Algorithm:
         1. Walk both trees in parallel by child index (positional comparison).
-        2. For each position, compare nodes via ``==``.
+        2. For each position, compare nodes via ``is``, then ``==``.
         3. If equal, skip the subtree (fast path — frozen nodes).
         4. If different types, emit removed + added.
         5. If same type but different content, emit modified.
@@ -54,6 +59,8 @@ def diff_documents(old: Document, new: Document) -> tuple[ASTChange, ...]:
     ordered tuples, not arbitrary sets.
 
     """
+    if old is new:
+        return ()
     changes: list[ASTChange] = []
     _diff_children(old.children, new.children, (), changes)
     return tuple(changes)
@@ -65,42 +72,37 @@ def _diff_children(
     parent_path: tuple[int, ...],
     changes: list[ASTChange],
 ) -> None:
-    """Recursively diff ordered child tuples.
+    """Diff ordered child tuples position by position.
 
-    Walks both tuples by index. For positions beyond one tuple's length,
-    emits additions or removals as appropriate.
+    Walks the common prefix of both tuples, then emits removals or
+    additions for the positions beyond the shorter one.  A path tuple is
+    only built for positions that produce a change, so an unchanged
+    sibling costs a single ``==``.
 
     """
-    max_len = max(len(old_children), len(new_children))
-
-    for i in range(max_len):
-        path = (*parent_path, i)
-
-        if i >= len(old_children):
-            # New node added at end
-            changes.append(
-                ASTChange(kind="added", path=path, old_node=None, new_node=new_children[i])
-            )
-        elif i >= len(new_children):
-            # Old node removed from end
-            changes.append(
-                ASTChange(kind="removed", path=path, old_node=old_children[i], new_node=None)
-            )
-        elif old_children[i] == new_children[i]:
-            # Identical subtree — skip (O(1) for frozen nodes)
+    if old_children is new_children:
+        return
+    append = changes.append
+
+    for i, (old_node, new_node) in enumerate(zip(old_children, new_children, strict=False)):
+        # Shared node: a pointer compare instead of a field-by-field ==
+        if old_node is new_node or old_node == new_node:
+            # Identical subtree — skip
             continue
-        elif type(old_children[i]) is type(new_children[i]):
+        path = (*parent_path, i)
+        if type(old_node) is type(new_node):
             # Same type, different content — modified
-            changes.append(
-                ASTChange(
-                    kind="modified", path=path, old_node=old_children[i], new_node=new_children[i]
-                )
-            )
+            append(ASTChange("modified", path, old_node, new_node))
         else:
             # Different types at same position — remove old, add new
-            changes.append(
-                ASTChange(kind="removed", path=path, old_node=old_children[i], new_node=None)
-            )
-            changes.append(
-                ASTChange(kind="added", path=path, old_node=None, new_node=new_children[i])
-            )
+            append(ASTChange("removed", path, old_node, None))
+            append(ASTChange("added", path, None, new_node))
+
+    # Length mismatch: at most one of these loops runs
+    common = min(len(old_children), len(new_children))
+    for i in range(common, len(old_children)):
+        # Old node removed from end
+        append(ASTChange("removed", (*parent_path, i), old_children[i], None))
+    for i in range(common, len(new_children)):
+        # New node added at end
+        append(ASTChange("added", (*parent_path, i), None, new_children[i]))
@@ -6,13 +6,19 @@ creating a unified URL space where static content and dynamic routes coexist.
 
 from __future__ import annotations
 
-import uuid
-from typing import TYPE_CHECKING, Any
-
-from chirp import Request
+import functools
+import inspect
+import operator
+import os
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from chirp import Request, Template
+from purr._runtime import gil_enabled, usable_cpu_count
 from purr.config import PurrConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from bengal.core.page import Page
     from bengal.core.site import Site
     from chirp import App
@@ -33,6 +39,9 @@ def _is_gated(page: object, key: str) -> bool:
 _DEFAULT_TEMPLATE = "page.html"
 _INDEX_TEMPLATE = "index.html"
 
+# Below this many pages, thread start-up costs more than preparing serially
+_PARALLEL_MIN_PAGES = 256
+
 # SSE endpoint path for reactive updates
 SSE_ENDPOINT = "/__purr/events"
 STATS_ENDPOINT = "/__purr/stats"
@@ -51,19 +60,72 @@ def _resolve_template_name(page: Page) -> str:
     and cascade inheritance.  Phase 1 keeps it simple: explicit override or default.
 
     """
+    # Each attribute is read once: hasattr() followed by a read would
+    # evaluate property-backed page fields twice
+
     # 1. Explicit template in frontmatter
-    explicit = page.metadata.get("template") if hasattr(page, "metadata") else None
+    metadata = getattr(page, "metadata", None)
+    explicit = metadata.get("template") if metadata else None
     if explicit:
         return str(explicit)
 
     # 2. Index pages use index.html
-    if hasattr(page, "source_path") and page.source_path and page.source_path.name == "_index.md":
+    source_path = getattr(page, "source_path", None)
+    if source_path and source_path.name == "_index.md":
         return _INDEX_TEMPLATE
 
     # 3. Default
     return _DEFAULT_TEMPLATE
 
 
+@functools.cache
+def _page_context_builder() -> Callable[..., dict[str, Any]]:
+    """Return Bengal's ``build_page_context``, imported on first page render.
+
+    Cached so a page request costs one call rather than a function-level
+    ``from ... import`` on every render.
+
+    """
+    from bengal.rendering.context import build_page_context
+
+    return build_page_context
+
+
+class _RouteSpec(NamedTuple):
+    """Everything needed to install one page route, computed up front."""
+
+    page: Page
+    permalink: str
+    template_name: str
+    gated: bool
+
+
+# Fetches both nav-label fields of a section in one C-level call
+_section_fields = operator.attrgetter("title", "name")
+
+
+def _nav_sections(sections: Iterable[object]) -> tuple[dict[str, object], ...]:
+    """Return ``{"title", "href"}`` nav entries for sections with a title or name.
+
+    Each attribute is fetched once per section; the filter reuses them.
+    The result is a tuple so one instance can be shared by every render.
+    """
+    nav: list[dict[str, object]] = []
+    append = nav.append
+    for section in sections:
+        try:
+            title, name = _section_fields(section)
+        except AttributeError:
+            # Section-like objects without the full attribute set
+            title = getattr(section, "title", None)
+            name = getattr(section, "name", None)
+        if not (title or name):
+            continue
+        href = getattr(section, "href", None)
+        append({"title": title or name, "href": href if href is not None else f"/{name}/"})
+    return tuple(nav)
+
+
 class ContentRouter:
     """Routes Bengal pages through Chirp's request/response cycle.
 
@@ -84,6 +146,11 @@ class ContentRouter:
         self._app = app
         self._config = config
         self._page_count = 0
+        # Nav entries and the sections sequence (and its length) they were
+        # built from — rebuilt only when the site's sections change
+        self._nav: tuple[dict[str, object], ...] = ()
+        self._nav_source: object = None
+        self._nav_len = -1
 
     @property
     def page_count(self) -> int:
@@ -100,23 +167,48 @@ class ContentRouter:
         Must be called before the Chirp app is frozen (before first request).
 
         """
-        for page in self._site.pages:
-            permalink = self._get_permalink(page)
-            if not permalink:
-                continue
+        pages = list(self._site.pages)
+
+        # Preparing specs only reads page attributes, so on a free-threaded
+        # build large sites spread it across cores.  Installation mutates
+        # the app and always runs serially, in page order.
+        if len(pages) >= _PARALLEL_MIN_PAGES and not gil_enabled():
+            from concurrent.futures import ThreadPoolExecutor
 
-            template_name = _resolve_template_name(page)
-            handler = self._make_page_handler(page, template_name)
+            with ThreadPoolExecutor(max_workers=usable_cpu_count()) as pool:
+                specs = list(pool.map(self._prepare_page, pages))
+        else:
+            specs = [self._prepare_page(page) for page in pages]
 
-            # Wrap gated pages with @login_required when auth is enabled
-            if self._config.auth and _is_gated(page, self._config.gated_metadata_key):
-                from chirp import login_required
+        for spec in specs:
+            if spec is not None:
+                self._install_route(spec)
 
-                handler = login_required(handler)
+    def _prepare_page(self, page: Page) -> _RouteSpec | None:
+        """Resolve a page's permalink, template, and gating (no side effects).
 
-            # Register as a Chirp route — use the decorator as a function call
-            self._app.route(permalink, name=f"page:{permalink}")(handler)
-            self._page_count += 1
+        Returns *None* for pages without a usable permalink.
+
+        """
+        permalink = self._get_permalink(page)
+        if not permalink:
+            return None
+        gated = self._config.auth and _is_gated(page, self._config.gated_metadata_key)
+        return _RouteSpec(page, permalink, _resolve_template_name(page), gated)
+
+    def _install_route(self, spec: _RouteSpec) -> None:
+        """Create the handler for a prepared page and register it on the app."""
+        handler: Any = self._make_page_handler(spec.page, spec.template_name, spec.permalink)
+
+        # Wrap gated pages with @login_required when auth is enabled
+        if spec.gated:
+            from chirp import login_required
+
+            handler = login_required(handler)
+
+        # Register as a Chirp route — use the decorator as a function call
+        self._app.route(spec.permalink, name=f"page:{spec.permalink}")(handler)
+        self._page_count += 1
 
     def _get_permalink(self, page: Page) -> str | None:
         """Extract the URL path for a page.
@@ -125,13 +217,16 @@ class ContentRouter:
         Returns *None* if no usable path can be determined.
 
         """
-        # Bengal pages expose href (template-ready URL with baseurl)
-        if hasattr(page, "href") and page.href:
-            return str(page.href)
+        # Bengal pages expose href (template-ready URL with baseurl).  Read
+        # once: it may be a computed property.
+        href = getattr(page, "href", None)
+        if href:
+            return str(href)
 
         # Fallback: internal site-relative path
-        if hasattr(page, "_path") and page._path:
-            path = str(page._path)
+        internal = getattr(page, "_path", None)
+        if internal:
+            path = str(internal)
             if not path.startswith("/"):
                 path = "/" + path
             return path
@@ -157,7 +252,7 @@ class ContentRouter:
         async def sse_handler(request: Request) -> Any:
             # Extract the page permalink from query params
             permalink = request.query.get("page", "/")
-            client_id = str(uuid.uuid4())
+            client_id = os.urandom(16).hex()
 
             conn = SSEConnection(client_id=client_id, permalink=permalink)
             broadcaster.subscribe(permalink, conn)
@@ -179,7 +274,8 @@ class ContentRouter:
     def register_stats_endpoint(self, collector: StackCollector) -> None:
         """Register the ``/__purr/stats`` JSON endpoint.
 
-        Returns aggregate pipeline profiling stats and event log summary.
+        Returns aggregate pipeline profiling stats, the event log summary,
+        and the startup stage durations from :mod:`purr.observability.timing`.
 
         Args:
             collector: StackCollector for accessing the event log.
@@ -187,17 +283,20 @@ class ContentRouter:
         """
         import json
 
-        async def stats_handler(request: Request) -> Any:
-            from chirp.http.response import Response
+        from chirp.http.response import Response
 
-            from purr.observability.profiler import compute_aggregate_stats
+        from purr.observability.profiler import compute_aggregate_stats
+        from purr.observability.timing import stage_times
 
+        async def stats_handler(request: Request) -> Any:
             stats = compute_aggregate_stats(collector.log)
             log_stats = collector.log.stats()
 
+            # Compact output: ``indent`` forces json's pure-Python encoder,
+            # and pollers or ``jq`` do their own formatting
             payload = json.dumps(
-                {"pipeline": stats, "event_log": log_stats},
-                indent=2,
+                {"pipeline": stats, "event_log": log_stats, "startup_ms": stage_times()},
+                separators=(",", ":"),
             )
 
             return Response(
@@ -211,46 +310,86 @@ class ContentRouter:
 
         self._app.route(STATS_ENDPOINT, name="purr:stats")(stats_handler)
 
-    def _make_page_handler(self, page: Page, template_name: str) -> Any:
-        """Create a Chirp route handler that renders a Bengal page.
+    def _current_nav(self) -> tuple[dict[str, object], ...]:
+        """Return nav entries for the site's sections, reusing the last build.
+
+        Rebuilt when ``site.sections`` is replaced or changes length (a
+        section added or removed in dev mode); otherwise every page render
+        shares one tuple.
 
-        The handler captures ``page``, ``site``, and ``template_name`` via closure.
-        On each request it builds the full Bengal template context and returns a
-        Chirp ``Template`` object for Kida to render.
+        """
+        sections = self._site.sections
+        if sections is not self._nav_source or len(sections) != self._nav_len:
+            self._nav = _nav_sections(sections)
+            self._nav_source = sections
+            self._nav_len = len(sections)
+        return self._nav
+
+    def _make_page_handler(
+        self, page: Page, template_name: str, permalink: str | None = None,
+    ) -> _PageHandler:
+        """Create a Chirp route handler that renders a Bengal page.
 
-        Enriches the context with:
-        - ``nav_sections``: top-level sections for navigation
-        - ``child_pages``: pages whose URL is a direct child of this page
-          (used by index.html to list section contents)
+        On each request the handler builds the full Bengal template context
+        and returns a Chirp ``Template`` object for Kida to render (see
+        :class:`_PageHandler`).  *permalink* defaults to the page's own.
 
         """
-        site = self._site
-        permalink = self._get_permalink(page) or "/"
+        if permalink is None:
+            permalink = self._get_permalink(page) or "/"
+        return _PageHandler(self, page, template_name, permalink)
+
+
+class _PageHandler:
+    """Chirp route handler for one Bengal page.
+
+    A slotted instance per page rather than a closure: every page route
+    shares this class's code, and a large site registers one small object
+    per page instead of a function, its cells, and two name strings.
+    ``__signature__`` is fixed, so Chirp's per-request
+    ``inspect.signature()`` returns it without introspecting ``__call__``.
+
+    Enriches the Bengal context with:
+    - ``nav_sections``: top-level sections for navigation
+    - ``child_pages``: pages whose URL is a direct child of this page
+      (used by index.html to list section contents)
+
+    """
+
+    __slots__ = ("_page", "_permalink", "_router", "_template_name")
+
+    __signature__ = inspect.Signature([
+        inspect.Parameter(
+            "request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request,
+        ),
+    ])
 
-        async def page_handler(request: Request) -> Any:
-            from bengal.rendering.context import build_page_context
-            from chirp import Template
+    def __init__(
+        self, router: ContentRouter, page: Page, template_name: str, permalink: str,
+    ) -> None:
+        self._router = router
+        self._page = page
+        self._template_name = template_name
+        self._permalink = permalink
 
-            content = page.html_content or ""
-            context = build_page_context(page, site, content=content, lazy=True)
+    async def __call__(self, request: Request) -> Any:
+        page = self._page
+        router = self._router
+        site = router._site
 
-            # Add navigation sections for base.html nav bar
-            context["nav_sections"] = [
-                {"title": s.title or s.name, "href": getattr(s, "href", f"/{s.name}/")}
-                for s in site.sections
-                if getattr(s, "title", None) or getattr(s, "name", None)
-            ]
+        content = page.html_content or ""
+        context = _page_context_builder()(page, site, content=content, lazy=True)
 
-            # Add child pages for index.html listings
-            context["child_pages"] = _child_pages(permalink, site.pages)
+        # Add navigation sections for base.html nav bar
+        context["nav_sections"] = router._current_nav()
 
-            return Template(template_name, **context)
+        # Add child pages for index.html listings
+        context["child_pages"] = _child_pages(self._permalink, site.pages)
 
-        # Give the handler a useful name for debugging
-        page_handler.__name__ = f"page_{self._page_count}"
-        page_handler.__qualname__ = f"ContentRouter.page_{self._page_count}"
+        return Template(self._template_name, **context)
 
-        return page_handler
+    def __repr__(self) -> str:
+        return f"<page handler {self._permalink} -> {self._template_name}>"
 
 
 def _child_pages(parent_href: str, all_pages: list[Page]) -> list[Page]:
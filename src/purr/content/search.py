@@ -0,0 +1,145 @@
+"""Search index — token lookup over Bengal pages for dynamic routes.
+
+``purr.search()`` builds an inverted index (token -> page ids) on the first
+search after the site is published or edited, so a search request costs one
+dict lookup per query token instead of a lowercase + substring scan over
+every page.
+
+Thread Safety:
+    The index is built once and never mutated afterwards.  Rebuilding (e.g.
+    after a content edit in dev mode) creates a new instance, so readers
+    always see a consistent snapshot.  Safe for free-threading.
+
+"""
+
+from __future__ import annotations
+
+import operator
+import re
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Word tokens — matches the query tokenizer so lookups are symmetric
+_TOKEN_RE = re.compile(r"\w+")
+
+# Content tokenizer: skips whole HTML tags and character references such as
+# ``&amp;`` (empty group) and captures word runs, so markup is dropped and
+# words are found in a single C-level scan
+_CONTENT_TOKEN_RE = re.compile(r"<[^>]*>|&#?\w+;|(\w+)")
+
+# Fetches all indexed page fields in one C-level call
+_page_fields = operator.attrgetter("title", "html_content", "name", "href")
+
+
+class Hit(NamedTuple):
+    """A search result — page title and link."""
+
+    title: str
+    href: str
+
+
+def _read_page(page: object) -> tuple[str, str, str, str]:
+    """Return ``(title, content, name, href)`` for a page, with defaults."""
+    try:
+        title, content, name, href = _page_fields(page)
+    except AttributeError:
+        # Page-like objects without the full attribute set
+        title = getattr(page, "title", "")
+        content = getattr(page, "html_content", "")
+        name = getattr(page, "name", "Untitled")
+        href = getattr(page, "href", "#")
+    return str(title or ""), str(content or ""), name or "Untitled", href or "#"
+
+
+def _tokenize(text: str) -> set[str]:
+    """Return the set of lowercase word tokens in *text*."""
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _tokenize_page(title_lower: str, content_lower: str) -> set[str]:
+    """Return the word tokens of an already-lowercased page, markup excluded."""
+    tokens = set(_TOKEN_RE.findall(title_lower))
+    tokens.update(_CONTENT_TOKEN_RE.findall(content_lower))
+    tokens.discard("")
+    return tokens
+
+
+class SearchIndex:
+    """Inverted index over page titles and rendered content.
+
+    Each page is assigned an id (its position in the page list).  The index
+    maps every lowercase word token to the sorted ids of the pages that
+    contain it.  Multi-word queries intersect the posting lists.
+
+    Queries shorter than two characters cannot be tokenized meaningfully,
+    so they fall back to a substring scan over titles and content.
+
+    Args:
+        pages: Bengal pages (anything exposing ``title``, ``html_content``,
+            ``name``, and ``href`` attributes).
+
+    """
+
+    def __init__(self, pages: Iterable[object]) -> None:
+        # Parallel per-page columns, indexed by page id.  Lowercased copies
+        # are made once here rather than on every fallback query.
+        self._records: list[Hit] = []
+        self._titles_lower: list[str] = []
+        self._contents_lower: list[str] = []
+        self._postings: dict[str, list[int]] = {}
+
+        postings = self._postings
+        for page_id, page in enumerate(pages):
+            title, content, name, href = _read_page(page)
+            title_lower = title.lower()
+            content_lower = content.lower()
+
+            self._records.append(Hit(title or name, href))
+            self._titles_lower.append(title_lower)
+            self._contents_lower.append(content_lower)
+
+            for token in _tokenize_page(title_lower, content_lower):
+                bucket = postings.get(token)
+                if bucket is None:
+                    postings[token] = [page_id]
+                else:
+                    bucket.append(page_id)
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the index."""
+        return len(self._records)
+
+    def search(self, query: str) -> list[Hit]:
+        """Return a :class:`Hit` for each page matching *query*.
+
+        Every query token must appear in the page (AND semantics).  Results
+        are returned in site page order.
+
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        tokens = _tokenize(query)
+        if len(query) < 2 or not tokens:
+            return self._substring_search(query)
+
+        postings = [self._postings.get(token) for token in tokens]
+        if any(p is None for p in postings):
+            return []
+
+        hits = set.intersection(*(set(p) for p in postings if p is not None))
+        return [self._records[page_id] for page_id in sorted(hits)]
+
+    def _substring_search(self, query: str) -> list[Hit]:
+        """Fallback scan for queries too short to tokenize."""
+        titles = self._titles_lower
+        contents = self._contents_lower
+        return [
+            record
+            for page_id, record in enumerate(self._records)
+            if query in titles[page_id] or query in contents[page_id]
+        ]
@@ -9,7 +9,9 @@ When a change is detected, triggers the appropriate pipeline path:
 
 Uses ``watchfiles.awatch`` (async) so the entire watcher lives inside the
 event loop — no background threads, no cross-boundary queues, and no
-event-loop binding issues on Python 3.14t free-threaded builds.
+event-loop binding issues on Python 3.14t free-threaded builds.  watchfiles
+is backed by the OS notification APIs (inotify, FSEvents,
+ReadDirectoryChangesW), so an idle dev server does no polling.
 """
 
 from __future__ import annotations
@@ -18,7 +20,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
-from watchfiles import Change
+from watchfiles import Change, DefaultFilter
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -50,6 +52,12 @@ _CHANGE_KIND_MAP: dict[Change, Literal["created", "modified", "deleted"]] = {
 }
 
 
+# Root-level files whose change invalidates every cached site and page
+_CONFIG_FILES = frozenset(
+    f"{stem}.{ext}" for stem in ("purr", "bengal") for ext in ("yaml", "yml", "toml")
+)
+
+
 def categorize_change(path: Path, config: PurrConfig) -> str | None:
     """Determine the category of a changed file based on its location.
 
@@ -65,8 +73,8 @@ def categorize_change(path: Path, config: PurrConfig) -> str | None:
     if not parts:
         return None
 
-    # Config file at root level
-    if len(parts) == 1 and parts[0] in {"purr.yaml", "purr.yml", "purr.toml"}:
+    # Purr or Bengal config file at root level
+    if len(parts) == 1 and parts[0] in _CONFIG_FILES:
         return "config"
 
     first_dir = parts[0]
@@ -83,12 +91,59 @@ def categorize_change(path: Path, config: PurrConfig) -> str | None:
     return None
 
 
+def _coalesce(
+    raw_changes: set[tuple[Change, str]],
+) -> dict[Path, Literal["created", "modified", "deleted"]]:
+    """Collapse one watchfiles batch to a single change per path.
+
+    Editors often save via write -> rename -> chmod, which lands in one
+    debounced batch as several entries for the same file.  The pipeline
+    should re-parse that file once, so each path maps to one kind: its
+    only change, or — when it saw several — whether it still exists.
+
+    """
+    seen: dict[Path, set[Change]] = {}
+    for change_type, path_str in raw_changes:
+        seen.setdefault(Path(path_str), set()).add(change_type)
+
+    result: dict[Path, Literal["created", "modified", "deleted"]] = {}
+    for path, changes in seen.items():
+        if len(changes) == 1:
+            result[path] = _CHANGE_KIND_MAP.get(next(iter(changes)), "modified")
+        else:
+            result[path] = "modified" if path.exists() else "deleted"
+    return result
+
+
+class WatchFilter(DefaultFilter):
+    """watchfiles filter that only admits paths purr reacts to.
+
+    Extends ``DefaultFilter`` (VCS directories, caches, editor swap and
+    backup files) with :func:`categorize_change`, so writes elsewhere under
+    the root — e.g. ``purr build`` output in ``dist/`` — are dropped before
+    a batch is yielded and never wake the event loop.
+
+    """
+
+    def __init__(self, config: PurrConfig) -> None:
+        super().__init__()
+        self._config = config
+
+    def __call__(self, change: Change, path: str) -> bool:
+        return super().__call__(change, path) and (
+            categorize_change(Path(path), self._config) is not None
+        )
+
+
 class ContentWatcher:
     """Watches for file changes and triggers reactive updates.
 
     Uses ``watchfiles.awatch`` for efficient async filesystem monitoring.
-    Categorizes changes by type (content, template, config, asset, route)
-    and yields them for consumption by the reactive pipeline.
+    Bursts of changes are debounced into one batch
+    (``PurrConfig.watch_debounce_ms``) and repeated changes to the same
+    path within a batch are coalesced.  Categorizes changes by type
+    (content, template, config, asset, route) and yields them for
+    consumption by the reactive pipeline.
 
     Lifecycle is managed entirely via async iteration and task cancellation
     — no background threads or queues required.
@@ -117,16 +172,14 @@ class ContentWatcher:
         try:
             async for raw_changes in awatch(
                 self._config.root,
-                debounce=50,
-                step=50,
+                watch_filter=WatchFilter(self._config),
+                debounce=self._config.watch_debounce_ms,
+                step=20,
             ):
-                for change_type, path_str in raw_changes:
-                    path = Path(path_str)
+                for path, kind in _coalesce(raw_changes).items():
                     category = categorize_change(path, self._config)
                     if category is None:
                         continue
-
-                    kind = _CHANGE_KIND_MAP.get(change_type, "modified")
                     yield ChangeEvent(path=path, kind=kind, category=category)
         finally:
             self._running = False
@@ -96,6 +96,8 @@ class StaticExporter:
         self._app = app
         self._config = config
         self._routes = routes
+        # Resolved on first render; the environment never changes after freeze
+        self._kida_env: object | None = None
 
     def export(self) -> ExportResult:
         """Run the full export pipeline and return the result.
@@ -240,20 +242,26 @@ class StaticExporter:
         return None
 
     def _get_kida_env(self) -> object:
-        """Get the Kida template environment, freezing the app if needed."""
+        """Get the Kida template environment, freezing the app if needed.
+
+        Resolved once per exporter — every rendered page goes through here.
+
+        """
+        if self._kida_env is not None:
+            return self._kida_env
+
         # Freeze the app if not already frozen — this initializes _kida_env
         if hasattr(self._app, "_ensure_frozen"):
             self._app._ensure_frozen()  # noqa: SLF001
 
-        kida_env = (
-            getattr(self._app, "_kida_env", None)
-            or getattr(self._app, "kida_env", None)
-            or getattr(self._app, "template_env", None)
-        )
+        # Chirp's App always defines ``_kida_env`` (a slot, set by freeze);
+        # the getattr default only covers app stand-ins without it
+        kida_env = getattr(self._app, "_kida_env", None)
         if kida_env is None:
             msg = "Cannot access Kida template environment from Chirp app"
             raise ExportError(msg)
 
+        self._kida_env = kida_env
         return kida_env
 
     def _render_template(self, template_name: str, context: dict) -> str:
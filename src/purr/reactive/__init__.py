@@ -5,7 +5,9 @@ block mapping, and SSE broadcasting.
 """
 
 from purr.reactive.broadcaster import Broadcaster, SSEConnection
+from purr.reactive.error_overlay import error_overlay_middleware
 from purr.reactive.graph import DependencyGraph
+from purr.reactive.hmr import hmr_middleware
 from purr.reactive.mapper import BlockUpdate, ReactiveMapper
 from purr.reactive.pipeline import ReactivePipeline
 
@@ -16,4 +18,6 @@ __all__ = [
     "ReactivePipeline",
     "ReactiveMapper",
     "SSEConnection",
+    "error_overlay_middleware",
+    "hmr_middleware",
 ]
@@ -9,6 +9,7 @@ EventStream to subscribed clients.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -20,6 +21,53 @@ if TYPE_CHECKING:
     from purr.reactive.mapper import BlockUpdate
 
 
+# Per-client backlog bound.  A stalled tab loses its oldest events instead
+# of growing without limit; the client recovers on its next full refresh.
+_QUEUE_MAXSIZE = 256
+
+
+def _new_queue() -> asyncio.Queue[Any]:
+    return asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+
+
+def _offer(queue: asyncio.Queue[Any], event: object) -> None:
+    """Enqueue *event* without blocking, dropping the oldest entry if full."""
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        with contextlib.suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+
+def _render_once(fragment: Any, kida_env: Any) -> Any:
+    """Render *fragment* to the SSE event every subscriber would produce.
+
+    Chirp's ``EventStream`` renders a yielded ``Fragment`` per connection;
+    rendering here instead lets all subscribers share one result.  If the
+    render fails the fragment is returned as-is, so each stream renders it
+    and reports the error inline in the affected block as before.
+
+    """
+    try:
+        from chirp import SSEEvent
+        from chirp.templating.integration import render_fragment
+
+        html = render_fragment(kida_env, fragment)
+    except Exception:
+        return fragment
+    return SSEEvent(data=html, event=fragment.target or "fragment")
+
+
+def _drain(queue: asyncio.Queue[Any]) -> None:
+    """Discard everything currently waiting in *queue*."""
+    try:
+        while True:
+            queue.get_nowait()
+    except asyncio.QueueEmpty:
+        pass
+
+
 @dataclass(frozen=True, slots=True)
 class SSEConnection:
     """A connected SSE client.
@@ -27,13 +75,14 @@ class SSEConnection:
     Attributes:
         client_id: Unique identifier for this connection.
         permalink: The page URL this client is viewing.
-        queue: asyncio.Queue[Any] for pushing events to the client's generator.
+        queue: Bounded asyncio.Queue[Any] for pushing events to the client's
+            generator.
 
     """
 
     client_id: str
     permalink: str
-    queue: asyncio.Queue[Any] = field(default_factory=asyncio.Queue, compare=False, hash=False)
+    queue: asyncio.Queue[Any] = field(default_factory=_new_queue, compare=False, hash=False)
 
 
 class Broadcaster:
@@ -46,7 +95,9 @@ class Broadcaster:
     2. Creates Chirp Fragment objects for each block update
     3. Pushes Fragments to subscribers of the affected page via their queues
 
-    Thread-safe: subscriber map protected by a lock.
+    Thread-safe: subscriber map protected by a lock, taken once per push to
+    snapshot every affected page.  Fanout itself is lock-free
+    ``put_nowait`` onto bounded per-client queues.
     Per-worker: each Pounce worker has its own Broadcaster instance.
 
     """
@@ -78,6 +129,15 @@ class Broadcaster:
         with self._lock:
             return frozenset(self._subscribers.get(permalink, set()))
 
+    def _snapshot(self, permalinks: set[str]) -> dict[str, tuple[SSEConnection, ...]]:
+        """Subscribers for several pages under a single lock acquisition."""
+        with self._lock:
+            return {
+                permalink: tuple(conns)
+                for permalink in permalinks
+                if (conns := self._subscribers.get(permalink))
+            }
+
     def get_subscribed_pages(self) -> frozenset[str]:
         """Get all pages that have at least one subscriber."""
         with self._lock:
@@ -87,15 +147,21 @@ class Broadcaster:
         self,
         updates: tuple[BlockUpdate, ...],
         page_context: dict[str, Any],
+        *,
+        kida_env: Any = None,
     ) -> int:
         """Push block updates to subscribers as Chirp Fragment objects.
 
         Creates a ``chirp.Fragment`` for each BlockUpdate and enqueues it
-        on every subscriber's queue for the affected page.
+        on every subscriber's queue for the affected page.  With *kida_env*
+        each fragment is rendered once here and the resulting ``SSEEvent``
+        is shared by all subscribers, instead of every client stream
+        rendering the same block.
 
         Args:
             updates: BlockUpdate objects from the ReactiveMapper.
             page_context: The updated template context for rendering.
+            kida_env: The app's Kida environment, if already created.
 
         Returns:
             Number of fragments pushed (updates x subscribers).
@@ -103,9 +169,13 @@ class Broadcaster:
         """
         from chirp import Fragment
 
+        snapshot = self._snapshot({update.permalink for update in updates})
+        if not snapshot:
+            return 0
+
         count = 0
         for update in updates:
-            subscribers = self.get_subscribers(update.permalink)
+            subscribers = snapshot.get(update.permalink)
             if not subscribers:
                 continue
 
@@ -114,13 +184,11 @@ class Broadcaster:
                 update.block_name,
                 **page_context,
             )
+            event = fragment if kida_env is None else _render_once(fragment, kida_env)
 
             for conn in subscribers:
-                try:
-                    conn.queue.put_nowait(fragment)
-                    count += 1
-                except asyncio.QueueFull:
-                    pass  # Drop if client queue is full
+                _offer(conn.queue, event)
+            count += len(subscribers)
 
         return count
 
@@ -128,6 +196,8 @@ class Broadcaster:
         """Signal all subscribers for a page to do a full page refresh.
 
         Sends a special SSE event that the client interprets as a refresh.
+        Anything still queued for those clients is discarded first — the
+        reload supersedes pending fragments.
 
         Returns:
             Number of clients notified.
@@ -138,15 +208,29 @@ class Broadcaster:
         subscribers = self.get_subscribers(permalink)
         event = SSEEvent(data="reload", event="purr:refresh")
 
-        count = 0
         for conn in subscribers:
-            try:
-                conn.queue.put_nowait(event)
-                count += 1
-            except asyncio.QueueFull:
-                pass
+            _drain(conn.queue)
+            _offer(conn.queue, event)
 
-        return count
+        return len(subscribers)
+
+    async def push_to_all(self, event: Any) -> int:
+        """Enqueue *event* for every connected client, whatever page it shows.
+
+        Never blocks: a stalled client drops its oldest queued event rather
+        than holding up delivery to everyone else.
+
+        Returns:
+            Number of clients notified.
+
+        """
+        with self._lock:
+            connections = [conn for conns in self._subscribers.values() for conn in conns]
+
+        for conn in connections:
+            _offer(conn.queue, event)
+
+        return len(connections)
 
     async def client_generator(self, conn: SSEConnection) -> AsyncIterator[Any]:
         """Async generator that yields events from a connection's queue.
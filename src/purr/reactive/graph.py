@@ -50,6 +50,9 @@ class DependencyGraph:
         self._block_meta_cache: dict[str, dict[str, frozenset[str]]] = {}
         # Cache parent -> children map for template inheritance (cascade detection)
         self._extends_map: dict[str, set[str]] | None = None
+        # Template name -> source paths of the pages rendered with it.  Built
+        # on first use, so constructing the graph never walks the site.
+        self._pages_by_template: dict[str, frozenset[Path]] | None = None
 
     @property
     def kida_env(self) -> Any:
@@ -73,9 +76,9 @@ class DependencyGraph:
     def pages_using_template(self, template_name: str) -> set[Path]:
         """Return source paths of pages that use the given template.
 
-        Uses site-model-based resolution: iterates site.pages and matches
-        by template name (from frontmatter/section). Works in dev mode
-        when EffectTracer is empty.
+        Uses site-model-based resolution: matches pages by template name
+        (from frontmatter/section) via an index built on first call. Works
+        in dev mode when EffectTracer is empty.
 
         Args:
             template_name: Template filename (e.g. "page.html", "index.html").
@@ -85,15 +88,28 @@ class DependencyGraph:
             Empty set if site is None (graceful degradation).
 
         """
-        if self._site is None:
-            return set()
-        result: set[Path] = set()
-        for page in self._site.pages:
-            if not hasattr(page, "source_path") or page.source_path is None:
-                continue
-            if _resolve_template_name(page) == template_name:
-                result.add(Path(page.source_path))
-        return result
+        return set(self._template_index().get(template_name, ()))
+
+    def _template_index(self) -> dict[str, frozenset[Path]]:
+        """Map each template name to the pages that use it.
+
+        Built lazily in one pass over ``site.pages`` and reused for every
+        later template change.  Page templates are resolved once at route
+        registration, so the mapping holds until a config change.
+
+        """
+        if self._pages_by_template is None:
+            index: dict[str, set[Path]] = {}
+            if self._site is not None:
+                for page in self._site.pages:
+                    source_path = getattr(page, "source_path", None)
+                    if source_path is None:
+                        continue
+                    index.setdefault(_resolve_template_name(page), set()).add(
+                        Path(source_path),
+                    )
+            self._pages_by_template = {name: frozenset(paths) for name, paths in index.items()}
+        return self._pages_by_template
 
     def block_deps_for_template(self, template_name: str) -> dict[str, frozenset[str]]:
         """Get block-level context dependencies for a template.
@@ -142,6 +158,7 @@ class DependencyGraph:
         """Clear all cached block metadata (e.g., after config change)."""
         self._block_meta_cache.clear()
         self._extends_map = None
+        self._pages_by_template = None
 
     def _build_extends_map(self) -> dict[str, set[str]]:
         """Build parent -> children map from Kida template_metadata().extends."""
@@ -150,11 +167,7 @@ class DependencyGraph:
         if env is None:
             return children_of
 
-        templates: set[str] = set()
-        if self._site is not None:
-            for page in self._site.pages:
-                if hasattr(page, "source_path") and page.source_path is not None:
-                    templates.add(_resolve_template_name(page))
+        templates: set[str] = set(self._template_index())
         loader = getattr(env, "loader", None)
         if loader is not None and hasattr(loader, "list_templates"):
             try:
@@ -86,11 +86,38 @@ _HMR_SCRIPT = """\
 """
 
 
+_HMR_SCRIPT_BYTES = _HMR_SCRIPT.encode("utf-8")
+
+# Insertion points, tried in order.  The real closing tag is the last one
+# in the document, so each is found with a single rfind from the end.
+_CLOSE_TAGS = ("</body>", "</html>")
+_CLOSE_TAGS_BYTES = tuple(tag.encode("ascii") for tag in _CLOSE_TAGS)
+
+
+def _inject(body: str) -> str:
+    """Insert the HMR script into a ``str`` body."""
+    for tag in _CLOSE_TAGS:
+        idx = body.rfind(tag)
+        if idx != -1:
+            return body[:idx] + _HMR_SCRIPT + body[idx:]
+    return body + _HMR_SCRIPT
+
+
+def _inject_bytes(body: bytes) -> bytes:
+    """Insert the HMR script into a ``bytes`` body without decoding it."""
+    for tag in _CLOSE_TAGS_BYTES:
+        idx = body.rfind(tag)
+        if idx != -1:
+            return body[:idx] + _HMR_SCRIPT_BYTES + body[idx:]
+    return body + _HMR_SCRIPT_BYTES
+
+
 async def hmr_middleware(request: Request, next: Next) -> AnyResponse:
     """Chirp middleware that injects the HMR script into HTML responses.
 
     Only modifies responses with ``text/html`` content type. Injects
-    the script tag just before ``</body>`` (or appends if no closing tag).
+    the script tag just before the last ``</body>`` (or ``</html>``, or
+    appends if neither is present).  ``bytes`` bodies are patched as bytes.
 
     """
     response = await next(request)
@@ -103,15 +130,5 @@ async def hmr_middleware(request: Request, next: Next) -> AnyResponse:
         return response
 
     body = response.body
-    if isinstance(body, bytes):
-        body = body.decode("utf-8")
-
-    # Inject before </body> if present, otherwise append
-    if "</body>" in body:
-        body = body.replace("</body>", _HMR_SCRIPT + "</body>", 1)
-    elif "</html>" in body:
-        body = body.replace("</html>", _HMR_SCRIPT + "</html>", 1)
-    else:
-        body += _HMR_SCRIPT
-
+    body = _inject_bytes(body) if isinstance(body, bytes) else _inject(body)
     return replace(response, body=body)
@@ -20,10 +20,13 @@ from __future__ import annotations
 
 import sys
 import time
+from collections import Counter
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from purr._runtime import gil_enabled, usable_cpu_count
 from purr.content.differ import diff_documents
 from purr.reactive.mapper import ReactiveMapper
 
@@ -37,6 +40,13 @@ if TYPE_CHECKING:
     from purr.reactive.graph import DependencyGraph
 
 
+# Below this many files, thread start-up costs more than seeding serially
+_PARALLEL_SEED_MIN_FILES = 64
+
+# Reads ASTChange.kind; Counter(map(...)) tallies kinds in one C-level pass
+_change_kind = attrgetter("kind")
+
+
 @dataclass(slots=True)
 class _CachedContent:
     """Cached content state: AST + source text for incremental parsing."""
@@ -222,12 +232,10 @@ class ReactivePipeline:
             return  # No structural changes
 
         if self._collector is not None:
-            added = sum(1 for c in changes if c.kind == "added")
-            removed = sum(1 for c in changes if c.kind == "removed")
-            modified = sum(1 for c in changes if c.kind == "modified")
+            kinds = Counter(map(_change_kind, changes))
             self._collector.record_diff(
                 str(path), changes_count=len(changes),
-                added=added, removed=removed, modified=modified,
+                added=kinds["added"], removed=kinds["removed"], modified=kinds["modified"],
             )
 
         # Find which page(s) this content file belongs to
@@ -270,7 +278,9 @@ class ReactivePipeline:
                 if profiler is not None:
                     profiler.start("broadcast")
                 context = self._build_page_context(page)
-                count = await self._broadcaster.push_updates(updates, context)
+                count = await self._broadcaster.push_updates(
+                    updates, context, kida_env=self._graph.kida_env,
+                )
                 if profiler is not None:
                     profiler.stop("broadcast")
                 duration_ms = (time.perf_counter() - t_recompile) * 1000
@@ -325,6 +335,8 @@ class ReactivePipeline:
 
     async def _broadcast_error(self, exc: BaseException, event: ChangeEvent) -> None:
         """Broadcast an error to all connected clients via SSE."""
+        from chirp import SSEEvent
+
         from purr.reactive.error_overlay import format_error_event
 
         print(
@@ -332,16 +344,9 @@ class ReactivePipeline:
             file=sys.stderr,
         )
 
+        # One shared event, queued without blocking on stalled clients
         payload = format_error_event(exc)
-        for permalink in self._broadcaster.get_subscribed_pages():
-            subscribers = self._broadcaster.get_subscribers(permalink)
-            for conn in subscribers:
-                try:
-                    from chirp.http.response import SSEEvent
-
-                    await conn.queue.put(SSEEvent(data=payload, event="purr:error"))
-                except Exception:
-                    pass
+        await self._broadcaster.push_to_all(SSEEvent(data=payload, event="purr:error"))
 
     async def _handle_config_change(self, event: ChangeEvent) -> None:
         """Config changed: invalidate all caches, push full refresh everywhere."""
@@ -531,6 +536,8 @@ class ReactivePipeline:
         Ensures full page loads serve fresh content, not just SSE fragment
         updates.  Strips frontmatter, re-renders the body via Patitas, and
         writes back to ``page.html_content`` and ``page._raw_content``.
+        Marks the ``purr.search()`` index stale when this pipeline's site
+        is the published one; it is rebuilt on the next search.
 
         """
         body = _strip_frontmatter(source)
@@ -543,6 +550,12 @@ class ReactivePipeline:
             page._raw_content = body
             break
 
+        # Let dynamic search routes see the edit
+        import purr
+
+        if purr._site_ref is self._site:
+            purr._invalidate_search()
+
     def _build_page_context(self, page: Any) -> dict[str, Any]:
         """Build the Bengal template context for a page."""
         try:
@@ -582,17 +595,41 @@ class ReactivePipeline:
         initial state.  Stores both the AST and source text for
         incremental parsing.
 
+        Safe to run in a background thread while the server is live: an
+        entry the watcher stored in the meantime is never overwritten, and
+        an edit that arrives before its file is seeded takes the
+        full-parse path.  On free-threaded builds large sites parse
+        across a thread pool.
+
         """
         from patitas import parse
 
+        paths: list[Path] = []
         for page in self._site.pages:
             if not hasattr(page, "source_path") or page.source_path is None:
                 continue
             path = Path(page.source_path)
             if path.is_file():
-                try:
-                    source = path.read_text(encoding="utf-8")
-                    doc = parse(source, source_file=str(path))
-                    self._content_cache[path] = _CachedContent(doc=doc, source=source)
-                except Exception as exc:
-                    print(f"  Cache seed error: {path.name}: {exc}", file=sys.stderr)
+                paths.append(path)
+
+        cache = self._content_cache
+
+        def seed_one(path: Path) -> None:
+            if path in cache:
+                return  # the watcher already stored a newer entry
+            try:
+                source = path.read_text(encoding="utf-8")
+                doc = parse(source, source_file=str(path))
+            except Exception as exc:
+                print(f"  Cache seed error: {path.name}: {exc}", file=sys.stderr)
+                return
+            cache.setdefault(path, _CachedContent(doc=doc, source=source))
+
+        if len(paths) >= _PARALLEL_SEED_MIN_FILES and not gil_enabled():
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=usable_cpu_count()) as pool:
+                list(pool.map(seed_one, paths))
+        else:
+            for path in paths:
+                seed_one(path)
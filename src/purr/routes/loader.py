@@ -22,6 +22,7 @@ Modules may export optional metadata:
 
 import importlib.util
 import inspect
+import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -90,25 +91,62 @@ def discover_routes(routes_dir: Path) -> tuple[RouteDefinition, ...]:
     start with ``_``.  Returns an empty tuple when *routes_dir* does not exist
     or contains no loadable modules.
 
+    Every call imports the route modules afresh, so module-level names
+    (``from purr import site``, configuration) bind to the current run.
+    Within one startup the result is passed along rather than
+    rediscovered (see ``purr.app._load_startup``).
+
     Raises:
         ConfigError: On duplicate URL paths or invalid handler signatures.
 
     """
-    if not routes_dir.is_dir():
+    # A missing directory scans as empty, so no separate is_dir() check
+    py_files = _scan_route_files(routes_dir)
+    if not py_files:
         return ()
+    return _load_routes(routes_dir, py_files)
+
+
+def _scan_route_files(routes_dir: Path) -> list[Path]:
+    """Return the route modules under *routes_dir*.
+
+    Walks with ``os.scandir``, which reports entry types without a
+    ``stat()`` per entry.  Directory symlinks are not followed.  Sorted
+    by path components, matching ``sorted(routes_dir.rglob("*.py"))``.
+
+    """
+    found: list[tuple[tuple[str, ...], str]] = []
+    stack: list[tuple[str, tuple[str, ...]]] = [(os.fspath(routes_dir), ())]
+    while stack:
+        dirpath, parts = stack.pop()
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if name != "__pycache__":
+                            stack.append((entry.path, (*parts, name)))
+                    elif name.endswith(".py") and not name.startswith("_"):
+                        found.append(((*parts, name), entry.path))
+        except OSError:
+            continue
+    found.sort()
+    return [Path(path) for _, path in found]
+
+
+def _load_routes(routes_dir: Path, py_files: list[Path]) -> tuple[RouteDefinition, ...]:
+    """Import *py_files* and collect their route definitions.
 
+    Raises:
+        ConfigError: On duplicate URL paths or invalid handler signatures.
+
+    """
     definitions: list[RouteDefinition] = []
     # Track (path, method) pairs to detect cross-file duplicates.
     # Multiple methods on the same path from the same module are fine.
     seen: dict[tuple[str, str], Path] = {}
 
-    for py_file in sorted(routes_dir.rglob("*.py")):
-        # Skip private files, __init__, and __pycache__ contents
-        if py_file.name.startswith("_"):
-            continue
-        if "__pycache__" in py_file.parts:
-            continue
-
+    for py_file in py_files:
         module = _load_module(py_file, routes_dir)
         if module is None:
             continue
@@ -138,16 +176,14 @@ def build_nav_entries(
     Entries are deduplicated by path and sorted alphabetically.
 
     """
-    seen: set[str] = set()
-    entries: list[NavEntry] = []
-
+    # First title wins per path; paths are unique, so sorting the items
+    # orders by path without a per-entry key function
+    titles: dict[str, str] = {}
     for defn in definitions:
-        if defn.nav_title is not None and defn.path not in seen:
-            seen.add(defn.path)
-            entries.append(NavEntry(path=defn.path, title=defn.nav_title))
+        if defn.nav_title is not None:
+            titles.setdefault(defn.path, defn.nav_title)
 
-    entries.sort(key=lambda e: e.path)
-    return tuple(entries)
+    return tuple(NavEntry(path, title) for path, title in sorted(titles.items()))
 
 
 def _load_module(py_file: Path, routes_dir: Path) -> object | None:
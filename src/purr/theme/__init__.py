@@ -11,6 +11,8 @@ Thread Safety:
 
 from __future__ import annotations
 
+import functools
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -18,11 +20,27 @@ if TYPE_CHECKING:
     from purr.config import PurrConfig
 
 
+@functools.cache
 def _bundled_theme_path() -> Path:
     """Return the absolute path to the bundled default theme."""
     return Path(__file__).parent / "default"
 
 
+@functools.lru_cache(maxsize=32)
+def _fallback_chain(user_dir: Path, bundled_subdir: str) -> tuple[Path, ...]:
+    """Return ``(user_dir, bundled/<subdir>)``, dropping a duplicate bundled dir.
+
+    Cached per user directory, so the paths are built once per site root
+    however many times an app, the static mount, or the reactive pipeline
+    asks for them.
+
+    """
+    bundled = _bundled_theme_path() / bundled_subdir
+    if user_dir == bundled:
+        return (bundled,)
+    return (user_dir, bundled)
+
+
 def get_template_dirs(config: PurrConfig) -> list[Path]:
     """Return template directories in priority order.
 
@@ -34,15 +52,8 @@ def get_template_dirs(config: PurrConfig) -> list[Path]:
     user may create it after startup in dev mode).
 
     """
-    bundled = _bundled_theme_path() / "templates"
-    user_dir = config.templates_path
-
-    dirs: list[Path] = []
     # User templates always first (even if dir doesn't exist yet)
-    if user_dir != bundled:
-        dirs.append(user_dir)
-    dirs.append(bundled)
-    return dirs
+    return list(_fallback_chain(config.templates_path, "templates"))
 
 
 def get_asset_dirs(config: PurrConfig) -> list[Path]:
@@ -54,11 +65,29 @@ def get_asset_dirs(config: PurrConfig) -> list[Path]:
     User assets take priority over bundled theme assets.
 
     """
-    bundled = _bundled_theme_path() / "assets"
-    user_dir = config.static_path
-
-    dirs: list[Path] = []
-    if user_dir != bundled:
-        dirs.append(user_dir)
-    dirs.append(bundled)
-    return dirs
+    return list(_fallback_chain(config.static_path, "assets"))
+
+
+def list_template_names(template_dir: Path) -> list[str]:
+    """Return loader names (``"partials/nav.html"``) of templates in a directory.
+
+    Walks the tree with ``os.scandir``, whose entries carry their file type,
+    so no per-file ``stat()`` or ``Path`` object is needed.  Returns names
+    sorted, or an empty list if the directory does not exist.
+
+    """
+    names: list[str] = []
+    stack: list[tuple[str, str]] = [(os.fspath(template_dir), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        stack.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.name.endswith(".html"):
+                        names.append(prefix + entry.name)
+        except OSError:
+            continue
+    names.sort()
+    return names
@@ -3,16 +3,28 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from purr._errors import ConfigError
+from purr._runtime import cgroup_cpu_quota
 from purr.app import (
+    _auto_workers,
+    _chirp_ui,
+    _clear_site_cache,
     _create_chirp_app,
+    _freeze_for_fork,
     _load_site,
+    _load_startup,
+    _markdown,
     _mount_static_files,
+    _parse_pages,
+    _precompile_templates,
+    _stack_collector,
     _start_watcher,
+    _template_loader,
     _wire_content_routes,
 )
 from purr.config import PurrConfig
@@ -38,6 +50,67 @@ class TestLoadSite:
         assert site is not None
         assert site.root_path == tmp_path
 
+    def test_reuses_site_when_sources_unchanged(self, tmp_path: Path) -> None:
+        (tmp_path / "bengal.toml").write_text('[site]\ntitle = "Test"\n')
+        assert _load_site(tmp_path) is _load_site(tmp_path)
+
+    def test_reloads_after_config_change(self, tmp_path: Path) -> None:
+        import os
+
+        config_file = tmp_path / "bengal.toml"
+        config_file.write_text('[site]\ntitle = "Test"\n')
+        first = _load_site(tmp_path)
+        mtime_ns = config_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
+        assert _load_site(tmp_path) is not first
+
+    def test_content_edit_not_detected(self, tmp_path: Path) -> None:
+        """Only config is checked; content edits need _clear_site_cache()."""
+        (tmp_path / "bengal.toml").write_text('[site]\ntitle = "Test"\n')
+        first = _load_site(tmp_path)
+        (tmp_path / "content").mkdir()
+        (tmp_path / "content" / "index.md").write_text("---\ntitle: Home\n---\nHi\n")
+        assert _load_site(tmp_path) is first
+
+    def test_no_reuse_bypasses_cache(self, tmp_path: Path) -> None:
+        (tmp_path / "bengal.toml").write_text('[site]\ntitle = "Test"\n')
+        _clear_site_cache()
+        private = _load_site(tmp_path, reuse=False)
+        shared = _load_site(tmp_path)
+        assert shared is not private
+        assert _load_site(tmp_path, reuse=False) is not shared
+
+    def test_clear_site_cache_forces_reload(self, tmp_path: Path) -> None:
+        (tmp_path / "bengal.toml").write_text('[site]\ntitle = "Test"\n')
+        first = _load_site(tmp_path)
+        _clear_site_cache()
+        assert _load_site(tmp_path) is not first
+
+
+class TestParsePages:
+    """_parse_pages — Markdown to HTML for discovered pages."""
+
+    def _site(self, count: int) -> SimpleNamespace:
+        pages = [SimpleNamespace(_raw_content=f"# Page {i}", html_content="") for i in range(count)]
+        pages.append(SimpleNamespace(_raw_content="", html_content="kept"))
+        return SimpleNamespace(pages=pages)
+
+    def test_parses_serially(self) -> None:
+        site = self._site(3)
+        _parse_pages(site)  # type: ignore[arg-type]
+        assert "Page 2" in site.pages[2].html_content
+        assert site.pages[-1].html_content == "kept"
+
+    def test_markdown_processor_shared(self) -> None:
+        assert _markdown() is _markdown()
+
+    def test_parallel_parse_keeps_page_order(self) -> None:
+        site = self._site(100)
+        with patch("purr.app.gil_enabled", return_value=False):
+            _parse_pages(site)  # type: ignore[arg-type]
+        assert all(f"Page {i}<" in p.html_content for i, p in enumerate(site.pages[:-1]))
+        assert site.pages[-1].html_content == "kept"
+
 
 class TestCreateChirpApp:
     """_create_chirp_app — Chirp App creation from PurrConfig."""
@@ -59,6 +132,143 @@ class TestCreateChirpApp:
         assert app.config.host == "0.0.0.0"
         assert app.config.port == 9000
 
+    def test_template_auto_reload_follows_debug(self, tmp_site: Path) -> None:
+        config = PurrConfig(root=tmp_site)
+        for debug in (False, True):
+            app = _create_chirp_app(config, debug=debug)
+            app._ensure_frozen()
+            assert app._kida_env.auto_reload is debug
+
+    def test_chirp_create_environment_untouched(self, tmp_site: Path) -> None:
+        import chirp.app as chirp_app
+        from chirp.templating import integration
+
+        _create_chirp_app(PurrConfig(root=tmp_site))
+        assert chirp_app.create_environment is integration.create_environment
+
+    def test_env_searches_all_template_dirs(self, tmp_site: Path) -> None:
+        app = _create_chirp_app(PurrConfig(root=tmp_site))
+        app._template_globals["marker"] = 1
+        app._ensure_frozen()
+        # Bundled theme template, found through the second search path
+        assert app._kida_env.get_template("base.html") is not None
+        assert app._kida_env.globals["marker"] == 1
+
+    def test_compiled_templates_shared_between_apps(self, tmp_site: Path) -> None:
+        from kida.compiler import Compiler
+
+        first = _create_chirp_app(PurrConfig(root=tmp_site))
+        first._ensure_frozen()
+        first._kida_env.get_template("base.html")
+
+        second = _create_chirp_app(PurrConfig(root=tmp_site))
+        second._ensure_frozen()
+        with patch.object(Compiler, "compile", side_effect=AssertionError("recompiled")):
+            assert second._kida_env.get_template("base.html") is not None
+
+    def test_chirp_ui_probe_cached(self) -> None:
+        assert _chirp_ui() is _chirp_ui()
+        assert _chirp_ui.cache_info().currsize == 1
+
+    def test_template_loader_shared_per_dir_chain(self, tmp_path: Path) -> None:
+        dirs = (tmp_path / "a", tmp_path / "b")
+        assert _template_loader(dirs) is _template_loader(dirs)
+        assert _template_loader(dirs) is not _template_loader(dirs[:1])
+
+
+class TestLoadStartup:
+    """_load_startup — concurrent site load, app creation, and route discovery."""
+
+    def test_returns_site_and_app(self, tmp_path: Path) -> None:
+        (tmp_path / "bengal.toml").write_text('[site]\ntitle = "Test"\n')
+        site, app, route_defs = _load_startup(PurrConfig(root=tmp_path), debug=True)
+        assert site.root_path == tmp_path
+        assert app.config.debug is True
+        assert route_defs == ()
+
+    def test_discovers_routes(self, tmp_path: Path) -> None:
+        (tmp_path / "bengal.toml").write_text('[site]\ntitle = "Test"\n')
+        routes = tmp_path / "routes"
+        routes.mkdir()
+        (routes / "ping.py").write_text("async def get(request):\n    return 'pong'\n")
+        startup = _load_startup(PurrConfig(root=tmp_path))
+        assert [d.path for d in startup.route_defs] == ["/ping"]
+        # Discovery does not register: that is left to _wire_dynamic_routes
+        assert not startup.app._pending_routes
+
+    def test_published_site_visible_to_route_imports(self, tmp_path: Path) -> None:
+        """Route modules doing ``from purr import site`` load under publish=True."""
+        import purr
+
+        (tmp_path / "bengal.toml").write_text('[site]\ntitle = "Test"\n')
+        routes = tmp_path / "routes"
+        routes.mkdir()
+        (routes / "about.py").write_text(
+            "from purr import site\n\nasync def get(request):\n    return site.title\n"
+        )
+        try:
+            startup = _load_startup(PurrConfig(root=tmp_path), publish=True)
+            assert purr.site is startup.site  # type: ignore[attr-defined]
+            assert [d.path for d in startup.route_defs] == ["/about"]
+        finally:
+            purr._site_ref = None
+            purr._search_index = None
+
+    def test_site_loads_off_the_calling_thread(self, tmp_path: Path) -> None:
+        import threading
+
+        threads: dict[str, str] = {}
+
+        def load_site(root: Path, *, reuse: bool = True) -> object:
+            threads["site"] = threading.current_thread().name
+            return object()
+
+        def create_app(config: PurrConfig, *, debug: bool = False) -> object:
+            threads["app"] = threading.current_thread().name
+            return object()
+
+        with (
+            patch("purr.app._load_site", side_effect=load_site),
+            patch("purr.app._create_chirp_app", side_effect=create_app),
+        ):
+            _load_startup(PurrConfig(root=tmp_path))
+
+        assert threads["app"] == threading.current_thread().name
+        assert threads["site"].startswith("purr-load")
+
+    def test_site_error_takes_precedence(self, tmp_path: Path) -> None:
+        config = PurrConfig(root=tmp_path / "nonexistent")
+        with (
+            patch("purr.app._create_chirp_app", side_effect=RuntimeError("app")),
+            pytest.raises(ConfigError, match="Failed to load Bengal site"),
+        ):
+            _load_startup(config)
+
+
+class TestPrecompileTemplates:
+    """_precompile_templates — warm Kida's template cache on startup."""
+
+    def test_registers_startup_hook(self, tmp_site: Path) -> None:
+        config = PurrConfig(root=tmp_site)
+        app = _create_chirp_app(config)
+        hooks_before = len(app._startup_hooks)
+
+        _precompile_templates(app, config)
+
+        assert len(app._startup_hooks) == hooks_before + 1
+
+    @pytest.mark.asyncio
+    async def test_startup_hook_compiles_templates(self, tmp_site: Path) -> None:
+        config = PurrConfig(root=tmp_site)
+        app = _create_chirp_app(config)
+        _precompile_templates(app, config)
+        app._ensure_frozen()
+
+        await app._startup_hooks[-1]()
+
+        assert app._kida_env._cache.get("page.html") is not None
+        assert app._kida_env._cache.get("index.html") is not None
+
 
 class TestWireContentRoutes:
     """_wire_content_routes — registering Bengal pages as Chirp routes."""
@@ -74,8 +284,9 @@ class TestWireContentRoutes:
         app = App(config=AppConfig(template_dir=tmp_path))
 
         config = PurrConfig(root=tmp_path)
-        _router, count = _wire_content_routes(site, app, config)
-        assert count == 2
+        wired = _wire_content_routes(site, app, config)
+        assert wired.page_count == 2
+        assert wired.router.page_count == 2
 
     def test_empty_site_returns_zero(self, tmp_path: Path) -> None:
         from chirp import App, AppConfig
@@ -109,6 +320,89 @@ class TestMountStaticFiles:
         # Should not raise — just skips silently
         _mount_static_files(app, config)
 
+    def test_skips_empty_static_dir_outside_dev(self, tmp_path: Path) -> None:
+        from chirp import App, AppConfig
+
+        (tmp_path / "static").mkdir()
+        config = PurrConfig(root=tmp_path)
+        app = App(config=AppConfig(template_dir=tmp_path))
+
+        with patch("purr.app.get_asset_dirs", return_value=[config.static_path]):
+            _mount_static_files(app, config)
+        assert app._middleware_list == []
+
+    def test_keeps_empty_static_dir_in_dev(self, tmp_path: Path) -> None:
+        from chirp import App, AppConfig
+
+        (tmp_path / "static").mkdir()
+        config = PurrConfig(root=tmp_path)
+        app = App(config=AppConfig(template_dir=tmp_path, debug=True))
+
+        with patch("purr.app.get_asset_dirs", return_value=[config.static_path]):
+            _mount_static_files(app, config)
+        assert len(app._middleware_list) == 1
+
+    def test_caches_responses_outside_dev(self, tmp_path: Path) -> None:
+        from chirp import App, AppConfig
+
+        from purr._static import CachedStaticFiles
+
+        (tmp_path / "static").mkdir()
+        asset = tmp_path / "static" / "site.css"
+        asset.write_text("body {}")
+        config = PurrConfig(root=tmp_path)
+        app = App(config=AppConfig(template_dir=tmp_path))
+
+        with patch("purr.app.get_asset_dirs", return_value=[config.static_path]):
+            _mount_static_files(app, config)
+
+        (middleware,) = app._middleware_list
+        assert isinstance(middleware, CachedStaticFiles)
+        first = middleware._serve_file(asset)
+        assert middleware._serve_file(asset) is first
+
+    @pytest.mark.asyncio
+    async def test_cached_static_remembers_hits_and_misses(self, tmp_path: Path) -> None:
+        from purr._static import CachedStaticFiles
+
+        (tmp_path / "site.css").write_text("body {}")
+        middleware = CachedStaticFiles(directory=tmp_path, prefix="/static")
+        fell_through: list[str] = []
+
+        async def app(request: object) -> str:
+            fell_through.append(request.path)  # type: ignore[attr-defined]
+            return "app"
+
+        hit = SimpleNamespace(method="GET", path="/static/site.css")
+        first = await middleware(hit, app)
+        (tmp_path / "site.css").unlink()
+        assert await middleware(hit, app) is first
+
+        miss = SimpleNamespace(method="GET", path="/static/late.css")
+        assert await middleware(miss, app) == "app"
+        (tmp_path / "late.css").write_text("")
+        assert await middleware(miss, app) == "app"
+        assert fell_through == ["/static/late.css", "/static/late.css"]
+
+    def test_several_dirs_mounted_as_one_chain(self, tmp_path: Path) -> None:
+        from chirp import App, AppConfig
+
+        from purr._static import StaticFilesChain
+
+        for name in ("static", "theme"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "site.css").write_text("body {}")
+        config = PurrConfig(root=tmp_path)
+        app = App(config=AppConfig(template_dir=tmp_path))
+
+        dirs = [tmp_path / "static", tmp_path / "theme"]
+        with patch("purr.app.get_asset_dirs", return_value=dirs):
+            _mount_static_files(app, config)
+
+        (middleware,) = app._middleware_list
+        assert isinstance(middleware, StaticFilesChain)
+        assert len(middleware._members) == 2
+
 
 class TestEndToEndRouting:
     """Full pipeline: Bengal pages served through Chirp routes via test client."""
@@ -301,3 +595,101 @@ class TestStartWatcher:
             # Clean up
             shutdown_hook = app._shutdown_hooks[-1]
             await shutdown_hook()
+
+    @pytest.mark.asyncio
+    async def test_config_change_clears_site_cache(self, tmp_site: Path) -> None:
+        """A config edit seen by the watcher drops memoized sites."""
+        import asyncio
+
+        from chirp import App, AppConfig
+        from watchfiles import Change
+
+        config = PurrConfig(root=tmp_site)
+        app = App(config=AppConfig(template_dir=tmp_site / "templates"))
+        pipeline = MagicMock()
+        pipeline.handle_change = AsyncMock()
+
+        async def _fake_awatch(*_args: object, **_kwargs: object):
+            yield {(Change.modified, str(tmp_site / "bengal.toml"))}
+
+        with (
+            patch("watchfiles.awatch", _fake_awatch),
+            patch("purr.app._clear_site_cache") as clear,
+        ):
+            _start_watcher(config, pipeline, app)
+            await app._startup_hooks[-1]()
+            await asyncio.sleep(0.05)
+            await app._shutdown_hooks[-1]()
+
+        clear.assert_called_once()
+        pipeline.handle_change.assert_awaited_once()
+
+
+class TestAutoWorkers:
+    """_auto_workers / cgroup_cpu_quota — container-aware worker defaults."""
+
+    def test_cgroup_v2_quota_rounds_up(self, tmp_path: Path) -> None:
+        (tmp_path / "cpu.max").write_text("150000 100000\n")
+        assert cgroup_cpu_quota(tmp_path) == 2
+
+    def test_cgroup_v2_unlimited(self, tmp_path: Path) -> None:
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+        assert cgroup_cpu_quota(tmp_path) is None
+
+    def test_cgroup_v1_quota(self, tmp_path: Path) -> None:
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("300000\n")
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+        assert cgroup_cpu_quota(tmp_path) == 3
+
+    def test_cgroup_v1_unlimited(self, tmp_path: Path) -> None:
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("-1\n")
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+        assert cgroup_cpu_quota(tmp_path) is None
+
+    def test_no_cgroup_files(self, tmp_path: Path) -> None:
+        assert cgroup_cpu_quota(tmp_path) is None
+
+    def test_quota_caps_cpu_count(self) -> None:
+        with (
+            patch("os.process_cpu_count", return_value=16),
+            patch("purr._runtime.cgroup_cpu_quota", return_value=2),
+        ):
+            assert _auto_workers() == 2
+
+
+class TestFreezeForFork:
+    """_freeze_for_fork — keep the site on shared pages for forked workers."""
+
+    def test_single_worker_not_frozen(self) -> None:
+        with patch("gc.freeze") as freeze:
+            assert _freeze_for_fork(1) is False
+        freeze.assert_not_called()
+
+    def test_thread_workers_not_frozen(self) -> None:
+        with (
+            patch("sys._is_gil_enabled", return_value=False, create=True),
+            patch("gc.freeze") as freeze,
+        ):
+            assert _freeze_for_fork(4) is False
+        freeze.assert_not_called()
+
+    def test_process_workers_frozen(self) -> None:
+        with (
+            patch("sys._is_gil_enabled", return_value=True, create=True),
+            patch("gc.freeze") as freeze,
+        ):
+            assert _freeze_for_fork(4) is True
+        freeze.assert_called_once()
+
+
+class TestStackCollector:
+    """_stack_collector — one observability collector per process."""
+
+    def test_shared_across_calls(self) -> None:
+        from purr.observability import StackCollector
+
+        collector = _stack_collector()
+        assert isinstance(collector, StackCollector)
+        assert _stack_collector() is collector
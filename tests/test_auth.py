@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -47,6 +48,19 @@ class TestResolveLoadUser:
         assert fn is not None
         assert callable(fn)
 
+    def test_module_executed_once_per_file_version(self, tmp_path: Path) -> None:
+        routes = tmp_path / "routes"
+        routes.mkdir()
+        auth = routes / "auth.py"
+        auth.write_text("async def load_user(user_id: str):\n    return None\n")
+        config = PurrConfig(root=tmp_path, auth_load_user="auth:load_user")
+        first = _resolve_load_user(config)
+        assert _resolve_load_user(config) is first
+
+        auth.write_text("async def load_user(user_id: str):\n    return user_id\n")
+        os.utime(auth, ns=(0, auth.stat().st_mtime_ns + 1_000_000))
+        assert _resolve_load_user(config) is not first
+
 
 class TestWireAuthMiddleware:
     """_wire_auth_middleware — session, auth, CSRF when auth=True."""
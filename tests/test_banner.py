@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import io
+import os
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from purr.banner import print_banner
+from purr.banner import _palette, _supports_color, print_banner
 from purr.config import PurrConfig
 
 
@@ -83,17 +84,68 @@ class TestPrintBanner:
     def test_no_color_respected(self) -> None:
         """When NO_COLOR is set, no ANSI escape codes should appear."""
         buf = io.StringIO()
-        with patch.dict("os.environ", {"NO_COLOR": "1"}):
-            # Re-import to pick up env change
-            import importlib
-
-            import purr.banner
-            importlib.reload(purr.banner)
-            with patch.object(sys, "stderr", buf):
+        _palette.cache_clear()  # re-detect with the patched environment
+        try:
+            with patch.dict("os.environ", {"NO_COLOR": "1"}), patch.object(sys, "stderr", buf):
                 config = PurrConfig(root=Path("/tmp/test-site"))
-                purr.banner.print_banner(config, page_count=1, mode="dev")
-            # Restore original
-            importlib.reload(purr.banner)
+                print_banner(config, page_count=1, mode="dev")
+        finally:
+            _palette.cache_clear()
 
         output = buf.getvalue()
         assert "\033[" not in output
+
+    def test_color_detected_on_first_banner_only(self) -> None:
+        _palette.cache_clear()
+        try:
+            with patch("purr.banner._supports_color", return_value=True) as detect:
+                output = self._capture_banner(mode="dev")
+                self._capture_banner(mode="serve")
+            detect.assert_called_once()
+            assert "\033[" in output
+        finally:
+            _palette.cache_clear()
+
+    def test_written_to_stderr_file_descriptor(self, tmp_path: Path) -> None:
+        """A real stderr file receives the banner through its descriptor."""
+        with (tmp_path / "stderr.txt").open("w+", encoding="utf-8") as stream:
+            stream.write("before\n")
+            with patch.object(sys, "stderr", stream):
+                config = PurrConfig(root=Path("/tmp/test-site"))
+                print_banner(config, page_count=2, mode="build")
+            stream.seek(0)
+            output = stream.read()
+
+        assert output.startswith("before\n")
+        assert "2 pages loaded" in output
+
+
+class TestSupportsColor:
+    """_supports_color — environment, TTY, then terminfo."""
+
+    def _detect(self, *, isatty: bool = True, colors: int | None = 256) -> tuple[bool, Mock]:
+        """Return the detection result and the terminfo lookup mock."""
+        stream = io.StringIO()
+        stream.isatty = lambda: isatty  # type: ignore[method-assign]
+        with (
+            patch.dict("os.environ", {"TERM": "xterm"}),
+            patch.object(sys, "stderr", stream),
+            patch("purr.banner._terminal_colors", return_value=colors) as terminfo,
+        ):
+            os.environ.pop("NO_COLOR", None)
+            return _supports_color(), terminfo
+
+    def test_color_tty(self) -> None:
+        assert self._detect()[0] is True
+
+    def test_not_a_tty_skips_terminfo(self) -> None:
+        result, terminfo = self._detect(isatty=False)
+        assert result is False
+        terminfo.assert_not_called()
+
+    def test_monochrome_terminal(self) -> None:
+        assert self._detect(colors=-1)[0] is False
+        assert self._detect(colors=2)[0] is False
+
+    def test_unknown_terminal_keeps_color(self) -> None:
+        assert self._detect(colors=None)[0] is True
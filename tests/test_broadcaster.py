@@ -172,6 +172,44 @@ class TestBroadcasterPush:
         assert count == 2
         assert conn.queue.qsize() == 2
 
+    @pytest.mark.asyncio
+    async def test_fragment_rendered_once_for_all_subscribers(self) -> None:
+        pytest.importorskip("chirp.templating.integration")
+        from unittest.mock import MagicMock
+
+        env = MagicMock()
+        env.get_template.return_value.render_block.return_value = "<p>new</p>"
+        b = Broadcaster()
+        c1 = _conn("c1", "/test/")
+        c2 = _conn("c2", "/test/")
+        b.subscribe("/test/", c1)
+        b.subscribe("/test/", c2)
+
+        await b.push_updates((_update(permalink="/test/"),), {}, kida_env=env)
+
+        event = c1.queue.get_nowait()
+        assert c2.queue.get_nowait() is event
+        assert event.data == "<p>new</p>"
+        assert event.event == "fragment"
+        env.get_template.return_value.render_block.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_render_left_to_each_stream(self) -> None:
+        pytest.importorskip("chirp.templating.integration")
+        from unittest.mock import MagicMock
+
+        from chirp import Fragment
+
+        env = MagicMock()
+        env.get_template.side_effect = RuntimeError("broken block")
+        b = Broadcaster()
+        conn = _conn("c1", "/test/")
+        b.subscribe("/test/", conn)
+
+        await b.push_updates((_update(permalink="/test/"),), {}, kida_env=env)
+
+        assert isinstance(conn.queue.get_nowait(), Fragment)
+
     @pytest.mark.asyncio
     async def test_push_full_refresh(self) -> None:
         b = Broadcaster()
@@ -185,6 +223,42 @@ class TestBroadcasterPush:
         assert event.event == "purr:refresh"
         assert event.data == "reload"
 
+    @pytest.mark.asyncio
+    async def test_push_to_all_reaches_every_page(self) -> None:
+        b = Broadcaster()
+        c1 = _conn("c1", "/a/")
+        c2 = _conn("c2", "/b/")
+        b.subscribe("/a/", c1)
+        b.subscribe("/b/", c2)
+
+        assert await b.push_to_all("event") == 2
+        assert c1.queue.get_nowait() == "event"
+        assert c2.queue.get_nowait() == "event"
+
+    @pytest.mark.asyncio
+    async def test_full_refresh_supersedes_queued_fragments(self) -> None:
+        b = Broadcaster()
+        conn = _conn("c1", "/test/")
+        b.subscribe("/test/", conn)
+        conn.queue.put_nowait("stale-fragment")
+
+        await b.push_full_refresh("/test/")
+
+        assert conn.queue.qsize() == 1
+        assert conn.queue.get_nowait().event == "purr:refresh"
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self) -> None:
+        b = Broadcaster()
+        conn = SSEConnection(client_id="c1", permalink="/test/", queue=asyncio.Queue(maxsize=1))
+        b.subscribe("/test/", conn)
+        conn.queue.put_nowait("old")
+
+        count = await b.push_updates((_update(permalink="/test/"),), {})
+
+        assert count == 1
+        assert conn.queue.get_nowait() != "old"
+
     @pytest.mark.asyncio
     async def test_push_full_refresh_no_subscribers(self) -> None:
         b = Broadcaster()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from purr._cli import _build_parser
+import pytest
+
+from purr._cli import _build_command_parser, _build_parser, main
 
 
 class TestBuildParser:
@@ -71,3 +73,28 @@ class TestBuildParser:
         parser = _build_parser()
         args = parser.parse_args([])
         assert args.command is None
+
+
+class TestBuildCommandParser:
+    """_build_command_parser — single-subcommand fast path."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["dev", "site", "--port", "4000"],
+            ["build", "--output", "out", "--base-url", "https://x.dev", "--fingerprint"],
+            ["serve", "--workers", "4"],
+        ],
+    )
+    def test_matches_full_parser(self, argv: list[str]) -> None:
+        full = _build_parser().parse_args(argv)
+        fast = _build_command_parser(argv[0]).parse_args(argv[1:])
+        assert vars(fast) == vars(full)
+
+    def test_version_skips_subcommands(self, capsys: pytest.CaptureFixture[str]) -> None:
+        from purr import __version__
+
+        with pytest.raises(SystemExit) as exc:
+            main(["--version"])
+        assert exc.value.code == 0
+        assert capsys.readouterr().out.strip() == f"purr {__version__}"
@@ -1,8 +1,14 @@
-"""Tests for purr.config."""
+"""Tests for purr.config and purr.config_loader."""
 
+import sys
+from dataclasses import replace
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from purr.config import PurrConfig
+from purr.config_loader import _read_purr_config, load_config
 
 
 class TestPurrConfig:
@@ -31,6 +37,16 @@ class TestPurrConfig:
         assert config.routes_path == tmp_path / "routes"
         assert config.output_path == tmp_path / "dist"
 
+    def test_paths_follow_replace(self, tmp_path: Path) -> None:
+        config = replace(PurrConfig(root=tmp_path), content_dir="pages", output=Path("out"))
+        assert config.content_path == tmp_path / "pages"
+        assert config.output_path == tmp_path / "out"
+
+    def test_paths_not_init_arguments_or_compared(self, tmp_path: Path) -> None:
+        with pytest.raises(TypeError):
+            PurrConfig(root=tmp_path, content_path=tmp_path)  # type: ignore[call-arg]
+        assert PurrConfig(root=tmp_path) == PurrConfig(root=tmp_path)
+
     def test_absolute_output_preserved(self, tmp_path: Path) -> None:
         output = Path("/tmp/custom-output")
         config = PurrConfig(root=tmp_path, output=output)
@@ -63,6 +79,9 @@ class TestPurrConfig:
         config = PurrConfig(fingerprint=True)
         assert config.fingerprint is True
 
+    def test_watch_debounce_default(self) -> None:
+        assert PurrConfig().watch_debounce_ms == 75
+
     def test_relative_root_resolved_to_absolute(self) -> None:
         """Relative root is resolved to absolute in __post_init__."""
         config = PurrConfig(root=Path("site"))
@@ -72,3 +91,72 @@ class TestPurrConfig:
         """Absolute root is not modified by __post_init__."""
         config = PurrConfig(root=tmp_path)
         assert config.root == tmp_path
+
+
+class TestLoadConfig:
+    """load_config — purr.yaml / purr.toml merged with overrides."""
+
+    def test_no_config_file(self, tmp_path: Path) -> None:
+        config = load_config(tmp_path)
+        assert config.port == 3000
+
+    def test_yaml_top_level_and_purr_section(self, tmp_path: Path) -> None:
+        pytest.importorskip("yaml")
+        (tmp_path / "purr.yaml").write_text(
+            "port: 4000\npurr:\n  host: 0.0.0.0\ntitle: ignored\n",
+            encoding="utf-8",
+        )
+        config = load_config(tmp_path)
+        assert config.port == 4000
+        assert config.host == "0.0.0.0"
+
+    def test_yaml_non_ascii_values(self, tmp_path: Path) -> None:
+        pytest.importorskip("yaml")
+        (tmp_path / "purr.yml").write_text("base_url: /café\n", encoding="utf-8")
+        assert load_config(tmp_path).base_url == "/café"
+
+    def test_invalid_yaml_ignored(self, tmp_path: Path) -> None:
+        pytest.importorskip("yaml")
+        (tmp_path / "purr.yaml").write_text("port: [unclosed\n", encoding="utf-8")
+        assert load_config(tmp_path).port == 3000
+
+    def test_toml(self, tmp_path: Path) -> None:
+        (tmp_path / "purr.toml").write_text("[purr]\nport = 5000\n", encoding="utf-8")
+        assert load_config(tmp_path).port == 5000
+
+    def test_yaml_not_imported_without_yaml_file(self, tmp_path: Path) -> None:
+        (tmp_path / "purr.toml").write_text("port = 5000\n", encoding="utf-8")
+        with patch.dict(sys.modules):
+            sys.modules.pop("yaml", None)
+            load_config(tmp_path)
+            load_config(tmp_path / "missing")
+            assert "yaml" not in sys.modules
+
+    def test_comment_only_yaml_skips_parser(self, tmp_path: Path) -> None:
+        (tmp_path / "purr.yaml").write_text("# port: 4000\n\n  # todo\n", encoding="utf-8")
+        with patch.dict(sys.modules):
+            sys.modules.pop("yaml", None)
+            assert load_config(tmp_path).port == 3000
+            assert "yaml" not in sys.modules
+
+    def test_overrides_win(self, tmp_path: Path) -> None:
+        (tmp_path / "purr.toml").write_text("port = 5000\n", encoding="utf-8")
+        assert load_config(tmp_path, port=6000).port == 6000
+
+    def test_unchanged_file_not_reparsed(self, tmp_path: Path) -> None:
+        (tmp_path / "purr.toml").write_text("port = 5000\n", encoding="utf-8")
+        load_config(tmp_path)
+        with patch("purr.config_loader._parse_toml", side_effect=AssertionError("reparsed")):
+            assert load_config(tmp_path).port == 5000
+
+    def test_edited_file_reparsed(self, tmp_path: Path) -> None:
+        path = tmp_path / "purr.toml"
+        path.write_text("port = 5000\n", encoding="utf-8")
+        load_config(tmp_path)
+        path.write_text("port = 50001\n", encoding="utf-8")
+        assert load_config(tmp_path).port == 50001
+
+    def test_cached_values_not_shared(self, tmp_path: Path) -> None:
+        (tmp_path / "purr.toml").write_text("port = 5000\n", encoding="utf-8")
+        _read_purr_config(tmp_path)["port"] = 1
+        assert _read_purr_config(tmp_path) == {"port": 5000}
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import SimpleNamespace
 
-from purr.content.router import ContentRouter, _resolve_template_name
+import pytest
+
+from purr.config import PurrConfig
+from purr.content import router as router_module
+from purr.content.router import ContentRouter, _nav_sections, _resolve_template_name
 
 from .conftest import make_test_page, make_test_site
 
@@ -36,6 +41,63 @@ class TestResolveTemplateName:
         )
         assert _resolve_template_name(page) == "home.html"
 
+    def test_page_without_metadata_or_source_uses_default(self) -> None:
+        assert _resolve_template_name(SimpleNamespace()) == "page.html"  # type: ignore[arg-type]
+
+
+class TestGetPermalink:
+    """Permalink extraction: href, then Bengal's internal _path."""
+
+    def _router(self) -> ContentRouter:
+        return ContentRouter(SimpleNamespace(pages=[]), None, PurrConfig())  # type: ignore[arg-type]
+
+    def test_href_property_read_once(self) -> None:
+        reads: list[int] = []
+
+        class _Page:
+            @property
+            def href(self) -> str:
+                reads.append(1)
+                return "/docs/"
+
+        assert self._router()._get_permalink(_Page()) == "/docs/"  # type: ignore[arg-type]
+        assert len(reads) == 1
+
+    def test_internal_path_fallback(self) -> None:
+        page = SimpleNamespace(href="", _path="docs/intro")
+        assert self._router()._get_permalink(page) == "/docs/intro"  # type: ignore[arg-type]
+
+    def test_no_usable_path(self) -> None:
+        assert self._router()._get_permalink(SimpleNamespace()) is None  # type: ignore[arg-type]
+
+
+class TestNavSections:
+    """Nav entries for the nav_sections template variable."""
+
+    def test_builds_entries_and_skips_unnamed(self) -> None:
+        sections = [
+            SimpleNamespace(title="Docs", name="docs", href="/docs/"),
+            SimpleNamespace(title="", name="blog"),
+            SimpleNamespace(title=None, name=None, href="/hidden/"),
+            SimpleNamespace(name="notes"),
+        ]
+        assert _nav_sections(sections) == (
+            {"title": "Docs", "href": "/docs/"},
+            {"title": "blog", "href": "/blog/"},
+            {"title": "notes", "href": "/notes/"},
+        )
+
+    def test_router_reuses_nav_until_sections_change(self) -> None:
+        sections = [SimpleNamespace(title="Docs", name="docs", href="/docs/")]
+        site = SimpleNamespace(pages=[], sections=sections)
+        router = ContentRouter(site, None, PurrConfig())  # type: ignore[arg-type]
+
+        nav = router._current_nav()
+        assert router._current_nav() is nav
+
+        sections.append(SimpleNamespace(title="Blog", name="blog", href="/blog/"))
+        assert len(router._current_nav()) == 2
+
 
 class TestContentRouter:
     """ContentRouter — registers Bengal pages as Chirp routes."""
@@ -57,6 +119,28 @@ class TestContentRouter:
 
         assert router.page_count == 3
 
+    def test_parallel_prepare_keeps_page_order(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Free-threaded preparation installs the same routes, in order."""
+        from chirp import App, AppConfig
+
+        monkeypatch.setattr(router_module, "_PARALLEL_MIN_PAGES", 1)
+        monkeypatch.setattr(router_module, "gil_enabled", lambda: False)
+
+        hrefs = [f"/p{i}/" for i in range(8)]
+        pages = [make_test_page(tmp_path / f"p{i}.md", href=h) for i, h in enumerate(hrefs)]
+        site = make_test_site(tmp_path, pages)
+        app = App(config=AppConfig(template_dir=tmp_path))
+
+        router = ContentRouter(site, app, PurrConfig(root=tmp_path))
+        router.register_pages()
+
+        assert router.page_count == 8
+        assert [r.path for r in app._pending_routes] == hrefs
+
     def test_page_count_starts_at_zero(self, tmp_path: Path) -> None:
         from chirp import App, AppConfig
 
@@ -105,4 +189,19 @@ class TestContentRouter:
         router = ContentRouter(site, app)
         handler = router._make_page_handler(page, "page.html")
 
-        assert inspect.iscoroutinefunction(handler)
+        # Calling the handler must return a coroutine for Chirp to await
+        coro = handler(None)
+        try:
+            assert inspect.iscoroutine(coro)
+        finally:
+            coro.close()
+
+    def test_route_handler_signature_takes_request(self, tmp_path: Path) -> None:
+        """Chirp injects the request by inspecting the handler signature."""
+        import inspect
+
+        page = SimpleNamespace(href="/page/")
+        router = ContentRouter(SimpleNamespace(pages=[page]), None, PurrConfig())  # type: ignore[arg-type]
+        handler = router._make_page_handler(page, "page.html")  # type: ignore[arg-type]
+
+        assert list(inspect.signature(handler).parameters) == ["request"]
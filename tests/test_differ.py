@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from patitas.location import SourceLocation
 from patitas.nodes import (
     Document,
@@ -73,6 +75,19 @@ class TestDiffDocuments:
         new = _doc(_paragraph("Same content"))
         assert diff_documents(old, new) == ()
 
+    def test_shared_nodes_skip_equality(self) -> None:
+        """Nodes reused between parses are matched by identity, not ==."""
+        shared = _paragraph("Reused")
+        old = _doc(shared, _paragraph("Old"))
+        new = _doc(shared, _paragraph("New"))
+        with patch.object(
+            Paragraph, "__eq__", autospec=True, side_effect=lambda a, b: a.children == b.children,
+        ) as eq:
+            changes = diff_documents(old, new)
+
+        assert [c.path for c in changes] == [(1,)]
+        assert eq.call_count == 1
+
     def test_empty_documents(self) -> None:
         assert diff_documents(_doc(), _doc()) == ()
 
@@ -211,3 +226,17 @@ class TestASTChangeDataclass:
         assert a == b
         assert hash(a) == hash(b)
         assert len({a, b}) == 1
+
+    def test_fields_by_name_and_position(self) -> None:
+        change = ASTChange("removed", (1, 0), "old", None)
+        assert change.kind == "removed"
+        assert change.path == (1, 0)
+        assert change == ASTChange(kind="removed", path=(1, 0), old_node="old", new_node=None)
+
+    def test_tuple_semantics(self) -> None:
+        """As a NamedTuple, ASTChange unpacks and equals a plain tuple of its fields."""
+        change = ASTChange("modified", (2,), "a", "b")
+        kind, path, old_node, new_node = change
+        assert (kind, path, old_node, new_node) == ("modified", (2,), "a", "b")
+        assert len(change) == 4
+        assert change == ("modified", (2,), "a", "b")
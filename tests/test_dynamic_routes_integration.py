@@ -1,6 +1,7 @@
 """Integration tests for Phase 3 — dynamic routes alongside static content."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +11,7 @@ from purr.app import (
     _wire_dynamic_routes,
 )
 from purr.config import PurrConfig
+from purr.routes.loader import discover_routes
 
 from .conftest import make_test_page, make_test_site
 
@@ -84,6 +86,17 @@ class TestWireDynamicRoutes:
         defs = _wire_dynamic_routes(app, config)
         assert defs == ()
 
+    def test_registers_prediscovered_definitions(self, site_with_routes: Path) -> None:
+        config = PurrConfig(root=site_with_routes)
+        app = _create_chirp_app(config)
+        found = discover_routes(config.routes_path)
+
+        with patch("purr.app.discover_routes") as discover:
+            defs = _wire_dynamic_routes(app, config, found)
+        discover.assert_not_called()
+        assert defs is found
+        assert len(app._pending_routes) == 2
+
     def test_injects_nav_entries_into_template_globals(
         self, site_with_routes: Path,
     ) -> None:
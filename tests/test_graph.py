@@ -179,6 +179,25 @@ class TestPagesUsingTemplate:
         )
         assert graph.pages_using_template("page.html") == set()
 
+    def test_site_walked_once_until_invalidated(self) -> None:
+        """The template index is built on first use and reused."""
+        site = MagicMock()
+        page = MagicMock()
+        page.source_path = Path("/site/content/a.md")
+        page.metadata = {}
+        site.pages = [page]
+
+        graph = DependencyGraph(
+            _mock_tracer(), _mock_app(_mock_kida_env()), site=site
+        )
+        assert graph.pages_using_template("page.html") == {Path("/site/content/a.md")}
+
+        site.pages = []
+        assert graph.pages_using_template("page.html") == {Path("/site/content/a.md")}
+
+        graph.invalidate_all_caches()
+        assert graph.pages_using_template("page.html") == set()
+
 
 class TestBlockDepsForTemplate:
     """Tests for DependencyGraph.block_deps_for_template()."""
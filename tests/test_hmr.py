@@ -81,6 +81,24 @@ class TestHMRMiddleware:
 
         assert result.body.endswith("</script>\n")
 
+    @pytest.mark.asyncio
+    async def test_bytes_body_injected_without_decoding(self) -> None:
+        html = "<html><body><p>café</p></body></html>".encode()
+        response = _MockResponse(body=html)  # type: ignore[arg-type]
+        result = await hmr_middleware(_mock_request(), _make_next(response))
+
+        assert isinstance(result.body, bytes)
+        assert result.body.index(b"data-purr-hmr") < result.body.index(b"</body>")
+        assert "café" in result.body.decode()
+
+    @pytest.mark.asyncio
+    async def test_injects_before_last_body_close(self) -> None:
+        html = '<body><script>var s = "</body>";</script></body>'
+        response = _MockResponse(body=html)
+        result = await hmr_middleware(_mock_request(), _make_next(response))
+
+        assert result.body.startswith(html[: -len("</body>")] + "<script data-purr-hmr>")
+
     @pytest.mark.asyncio
     async def test_skips_non_html_response(self) -> None:
         response = _MockResponse(body='{"key": "value"}', content_type="application/json")
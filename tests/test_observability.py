@@ -13,6 +13,7 @@ from purr.observability.events import (
     now_ns,
 )
 from purr.observability.log import EventLog
+from purr.observability.timing import reset_stages, stage, stage_times
 
 
 # ---------------------------------------------------------------------------
@@ -259,3 +260,38 @@ class TestEventDataclasses:
         t1 = now_ns()
         t2 = now_ns()
         assert t2 >= t1
+
+
+# ---------------------------------------------------------------------------
+# Startup stage timing
+# ---------------------------------------------------------------------------
+
+
+class TestStageTiming:
+    """Tests for startup stage timing."""
+
+    def test_records_stages_in_run_order(self) -> None:
+        reset_stages()
+        with stage("load"):
+            time.sleep(0.001)
+        with stage("wire"):
+            pass
+
+        times = stage_times()
+        assert list(times) == ["load", "wire"]
+        assert times["load"] >= 1.0
+
+    def test_records_stage_that_raises(self) -> None:
+        reset_stages()
+        try:
+            with stage("load"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+        assert "load" in stage_times()
+
+    def test_reset_clears_stages(self) -> None:
+        with stage("load"):
+            pass
+        reset_stages()
+        assert stage_times() == {}
@@ -20,6 +20,12 @@ class TestPackageMetadata:
                 continue
             getattr(purr, name)
 
+    def test_lazy_exports_cached_in_module(self) -> None:
+        from purr.app import dev
+
+        assert purr.dev is dev  # type: ignore[attr-defined]
+        assert vars(purr)["dev"] is dev
+
     def test_invalid_attribute_raises(self) -> None:
         import pytest
 
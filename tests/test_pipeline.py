@@ -179,6 +179,31 @@ class TestPipelineContentChange:
         # Same doc -> empty diff -> no updates
         assert pipeline._broadcaster.subscriber_count == 0
 
+    @pytest.mark.asyncio
+    async def test_diff_kinds_recorded(self, pipeline: ReactivePipeline) -> None:
+        """The collector receives per-kind counts for the diff."""
+        collector = MagicMock()
+        pipeline._collector = collector
+        path = Path("/site/content/page.md")
+        pipeline._content_cache[path] = _CachedContent(doc=MagicMock(), source="old\n")
+        changes = (
+            ASTChange("added", (0,), None, "a"),
+            ASTChange("added", (1,), None, "b"),
+            ASTChange("modified", (2,), "c", "d"),
+        )
+
+        event = ChangeEvent(path=path, kind="modified", category="content")
+        with (
+            patch.object(Path, "read_text", return_value="new\n"),
+            patch.object(pipeline, "_parse_content_incremental", return_value=MagicMock()),
+            patch("purr.reactive.pipeline.diff_documents", return_value=changes),
+        ):
+            await pipeline.handle_change(event)
+
+        collector.record_diff.assert_called_once_with(
+            str(path), changes_count=3, added=2, removed=0, modified=1,
+        )
+
 
 class TestPipelineTemplateChange:
     """Tests for handling template changes."""
@@ -413,6 +438,35 @@ class TestPipelineAssetChange:
         assert pipeline._broadcaster.subscriber_count == 0
 
 
+class TestPipelineErrorBroadcast:
+    """Pipeline failures reach every client as one purr:error event."""
+
+    @pytest.mark.asyncio
+    async def test_error_event_pushed_to_all_pages(
+        self, pipeline: ReactivePipeline, broadcaster: Broadcaster
+    ) -> None:
+        from purr.reactive.broadcaster import SSEConnection
+
+        c1 = SSEConnection(client_id="c1", permalink="/a/")
+        c2 = SSEConnection(client_id="c2", permalink="/b/")
+        broadcaster.subscribe("/a/", c1)
+        broadcaster.subscribe("/b/", c2)
+
+        event = ChangeEvent(
+            path=Path("/site/templates/page.html"),
+            kind="modified",
+            category="template",
+        )
+        with patch.object(
+            pipeline, "_handle_template_change_inner", side_effect=RuntimeError("boom"),
+        ):
+            await pipeline.handle_change(event)
+
+        item = c1.queue.get_nowait()
+        assert item.event == "purr:error"
+        assert c2.queue.get_nowait() is item
+
+
 class TestSeedASTCache:
     """Tests for seed_ast_cache()."""
 
@@ -431,6 +485,23 @@ class TestSeedASTCache:
         assert mock_parse.called
         assert Path("/site/content/page.md") in pipeline._content_cache
 
+    def test_seed_keeps_newer_watcher_entry(self, pipeline: ReactivePipeline) -> None:
+        """An entry stored by the watcher while seeding ran is not clobbered."""
+        path = Path("/site/content/page.md")
+        pipeline._site.pages[0].source_path = path
+        newer = MagicMock()
+        pipeline._content_cache[path] = newer
+
+        with (
+            patch.object(Path, "is_file", return_value=True),
+            patch.object(Path, "read_text", return_value="# Hello\n"),
+            patch("patitas.parse", return_value=MagicMock()) as mock_parse,
+        ):
+            pipeline.seed_ast_cache()
+
+        assert pipeline._content_cache[path] is newer
+        mock_parse.assert_not_called()
+
 
 class TestIncrementalParsing:
     """Tests for the incremental parsing integration."""
@@ -317,6 +317,30 @@ class TestDiscoverRoutes:
         defs = discover_routes(routes_dir)
         assert defs[0].source == py_file
 
+    def test_routes_reimported_on_each_discovery(self, routes_dir: Path) -> None:
+        """Module-level state binds to the current run, not an earlier one."""
+        _write_route(routes_dir, "count.py", (
+            "import builtins\n"
+            "builtins.purr_route_imports = getattr(builtins, 'purr_route_imports', 0) + 1\n"
+            "async def get(request):\n"
+            "    return 'count'\n"
+        ))
+        import builtins
+
+        try:
+            first = discover_routes(routes_dir)
+            second = discover_routes(routes_dir)
+            assert second[0].handler is not first[0].handler
+            assert builtins.purr_route_imports == 2  # type: ignore[attr-defined]
+        finally:
+            del builtins.purr_route_imports  # type: ignore[attr-defined]
+
+    def test_added_route_file_rediscovered(self, routes_dir: Path) -> None:
+        _write_route(routes_dir, "a.py", "async def get(request):\n    return 'a'\n")
+        assert len(discover_routes(routes_dir)) == 1
+        _write_route(routes_dir, "sub/b.py", "async def get(request):\n    return 'b'\n")
+        assert [d.path for d in discover_routes(routes_dir)] == ["/a", "/sub/b"]
+
 
 # ---------------------------------------------------------------------------
 # build_nav_entries
@@ -0,0 +1,114 @@
+"""Tests for purr.content.search — the prebuilt page search index."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import purr
+from purr.content.search import Hit, SearchIndex
+
+
+def _page(title: str, html: str, href: str) -> SimpleNamespace:
+    return SimpleNamespace(title=title, html_content=html, name=title.lower(), href=href)
+
+
+_PAGES = [
+    _page("Getting Started", "<p>Install purr and run the dev server.</p>", "/docs/start/"),
+    _page("API Reference", "<h2>Server</h2><p>The serve() function.</p>", "/docs/api/"),
+    _page("Deep Dives", "<p>Reactive pipeline internals.</p>", "/premium/deep/"),
+]
+
+
+class TestSearchIndex:
+    """SearchIndex — token lookup over titles and content."""
+
+    def test_matches_title_token(self) -> None:
+        index = SearchIndex(_PAGES)
+        assert index.search("reference") == [Hit("API Reference", "/docs/api/")]
+
+    def test_matches_content_token_case_insensitive(self) -> None:
+        index = SearchIndex(_PAGES)
+        hits = index.search("PIPELINE")
+        assert [h.href for h in hits] == ["/premium/deep/"]
+
+    def test_all_tokens_must_match(self) -> None:
+        index = SearchIndex(_PAGES)
+        assert [h.href for h in index.search("dev server")] == ["/docs/start/"]
+        assert index.search("dev internals") == []
+
+    def test_html_tags_not_indexed(self) -> None:
+        index = SearchIndex(_PAGES)
+        assert index.search("h2") == []
+
+    def test_words_adjacent_to_tags_indexed(self) -> None:
+        page = _page("Tags", "<p>alpha</p><b>beta</b>gamma<br/>", "/t/")
+        index = SearchIndex([page])
+        assert index.search("alpha beta gamma") == [Hit("Tags", "/t/")]
+        assert index.search("br") == []
+
+    def test_html_entities_not_indexed(self) -> None:
+        page = _page("Cartoons", "<p>Tom &amp; Jerry &lt;3 &#39;toon&#x27;</p>", "/c/")
+        index = SearchIndex([page])
+        assert index.search("amp") == []
+        assert index.search("lt") == []
+        assert index.search("x27") == []
+        assert index.search("jerry toon") == [Hit("Cartoons", "/c/")]
+
+    def test_results_in_page_order(self) -> None:
+        index = SearchIndex(_PAGES)
+        hits = index.search("the")
+        assert [h.href for h in hits] == ["/docs/start/", "/docs/api/"]
+
+    def test_single_char_query_uses_substring_scan(self) -> None:
+        index = SearchIndex(_PAGES)
+        hits = index.search("z")
+        assert [h.href for h in hits] == []
+        assert len(index.search("e")) == 3
+
+    def test_empty_query_returns_nothing(self) -> None:
+        assert SearchIndex(_PAGES).search("   ") == []
+
+    def test_untitled_page_uses_name(self) -> None:
+        page = SimpleNamespace(title="", html_content="<p>orphan</p>", name="orphan", href="/o/")
+        assert SearchIndex([page]).search("orphan") == [Hit("orphan", "/o/")]
+
+
+class TestPurrSearch:
+    """purr.search — module-level search over the site published by _set_site()."""
+
+    def test_empty_before_init(self) -> None:
+        purr._site_ref = None
+        purr._search_index = None
+        assert purr.search("purr") == []
+
+    def test_uses_published_site(self) -> None:
+        try:
+            purr._set_site(SimpleNamespace(pages=_PAGES))  # type: ignore[arg-type]
+            assert [h.href for h in purr.search("install")] == ["/docs/start/"]
+        finally:
+            purr._site_ref = None
+            purr._search_index = None
+
+    def test_index_built_by_set_site_and_reused(self) -> None:
+        try:
+            purr._set_site(SimpleNamespace(pages=_PAGES))  # type: ignore[arg-type]
+            index = purr._search_index
+            assert index is not None
+            assert index.page_count == len(_PAGES)
+            purr.search("install")
+            assert purr._search_index is index
+        finally:
+            purr._site_ref = None
+            purr._search_index = None
+
+    def test_invalidate_picks_up_in_place_edit(self) -> None:
+        pages = [_page("Notes", "<p>draft</p>", "/notes/")]
+        try:
+            purr._set_site(SimpleNamespace(pages=pages))  # type: ignore[arg-type]
+            assert purr.search("final") == []
+            pages[0].html_content = "<p>final</p>"
+            purr._invalidate_search()
+            assert [h.href for h in purr.search("final")] == ["/notes/"]
+        finally:
+            purr._site_ref = None
+            purr._search_index = None
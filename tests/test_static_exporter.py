@@ -327,11 +327,20 @@ class TestGetKidaEnv:
         app._ensure_frozen.assert_called_once()
         assert result is mock_env
 
+    def test_resolves_env_once(self, tmp_path: Path) -> None:
+        app = MagicMock()
+        app._kida_env = MagicMock()
+
+        exporter = _make_exporter(tmp_path, app=app)
+        first = exporter._get_kida_env()
+
+        assert exporter._get_kida_env() is first
+        app._ensure_frozen.assert_called_once()
+
     def test_raises_when_no_env(self, tmp_path: Path) -> None:
         app = MagicMock()
         app._kida_env = None
-        app.kida_env = None
-        app.template_env = None
+        app.kida_env = MagicMock()  # only Chirp's _kida_env is consulted
 
         exporter = _make_exporter(tmp_path, app=app)
         with pytest.raises(ExportError, match="Cannot access Kida"):
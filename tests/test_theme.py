@@ -5,7 +5,12 @@ from __future__ import annotations
 from pathlib import Path
 
 from purr.config import PurrConfig
-from purr.theme import _bundled_theme_path, get_asset_dirs, get_template_dirs
+from purr.theme import (
+    _bundled_theme_path,
+    get_asset_dirs,
+    get_template_dirs,
+    list_template_names,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -113,6 +118,15 @@ class TestFallbackChain:
         assert dirs[0] == tmp_path / "assets"
         assert dirs[1] == _bundled_theme_path() / "assets"
 
+    def test_repeat_calls_return_independent_lists(self, tmp_path: Path) -> None:
+        config = PurrConfig(root=tmp_path)
+        first = get_template_dirs(config)
+        first.append(tmp_path / "extra")
+        assert get_template_dirs(config) == [
+            tmp_path / "templates",
+            _bundled_theme_path() / "templates",
+        ]
+
     def test_no_duplicate_when_pointing_to_bundled(self) -> None:
         """If user templates_dir somehow points to the bundled dir, no dup."""
         bundled = _bundled_theme_path() / "templates"
@@ -121,3 +135,21 @@ class TestFallbackChain:
 
         assert len(dirs) == 1
         assert dirs[0] == bundled
+
+
+class TestListTemplateNames:
+    """list_template_names — loader-relative names from a scandir walk."""
+
+    def test_nested_names_sorted(self, tmp_path: Path) -> None:
+        (tmp_path / "partials").mkdir()
+        (tmp_path / "page.html").write_text("")
+        (tmp_path / "partials" / "nav.html").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+        assert list_template_names(tmp_path) == ["page.html", "partials/nav.html"]
+
+    def test_missing_dir_is_empty(self, tmp_path: Path) -> None:
+        assert list_template_names(tmp_path / "nope") == []
+
+    def test_bundled_templates_listed(self) -> None:
+        names = list_template_names(_bundled_theme_path() / "templates")
+        assert {"base.html", "page.html", "index.html", "404.html"} <= set(names)
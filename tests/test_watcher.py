@@ -7,7 +7,9 @@ from pathlib import Path
 import pytest
 
 from purr.config import PurrConfig
-from purr.content.watcher import ChangeEvent, categorize_change
+from watchfiles import Change
+
+from purr.content.watcher import ChangeEvent, WatchFilter, _coalesce, categorize_change
 
 
 # ---------------------------------------------------------------------------
@@ -90,6 +92,10 @@ class TestCategorizeChange:
         path = config.root / "purr.toml"
         assert categorize_change(path, config) == "config"
 
+    def test_bengal_config(self, config: PurrConfig) -> None:
+        path = config.root / "bengal.toml"
+        assert categorize_change(path, config) == "config"
+
     def test_unknown_file_returns_none(self, config: PurrConfig) -> None:
         path = config.root / "random" / "file.txt"
         assert categorize_change(path, config) is None
@@ -114,3 +120,38 @@ class TestCategorizeChange:
         config = PurrConfig(root=tmp_path, templates_dir="layouts")
         path = tmp_path / "layouts" / "base.html"
         assert categorize_change(path, config) == "template"
+
+
+class TestWatchFilter:
+    """WatchFilter — drops paths outside purr's watched categories."""
+
+    def test_accepts_content(self, config: PurrConfig) -> None:
+        path = config.root / "content" / "page.md"
+        assert WatchFilter(config)(Change.modified, str(path))
+
+    def test_rejects_build_output(self, config: PurrConfig) -> None:
+        path = config.root / "dist" / "index.html"
+        assert not WatchFilter(config)(Change.added, str(path))
+
+    def test_rejects_editor_swap_file(self, config: PurrConfig) -> None:
+        path = config.root / "content" / ".page.md.swp"
+        assert not WatchFilter(config)(Change.modified, str(path))
+
+
+class TestCoalesce:
+    """_coalesce — one change per path per batch."""
+
+    def test_single_change_keeps_kind(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.md"
+        assert _coalesce({(Change.added, str(path))}) == {path: "created"}
+
+    def test_burst_on_existing_file_is_modified(self, tmp_path: Path) -> None:
+        path = tmp_path / "a.md"
+        path.write_text("x")
+        raw = {(Change.deleted, str(path)), (Change.added, str(path)), (Change.modified, str(path))}
+        assert _coalesce(raw) == {path: "modified"}
+
+    def test_burst_on_missing_file_is_deleted(self, tmp_path: Path) -> None:
+        path = tmp_path / "gone.md"
+        raw = {(Change.modified, str(path)), (Change.deleted, str(path))}
+        assert _coalesce(raw) == {path: "deleted"}